@@ -1,4 +1,11 @@
 """Amazon Connect MCP Server."""
-from .server import mcp, main
 
 __all__ = ["mcp", "main"]
+
+
+def __getattr__(name: str):
+    # Load the server lazily so importing a submodule doesn't build every tool
+    if name in __all__:
+        from . import server
+        return getattr(server, name)
+    raise AttributeError(f"module {__name__!r} has no attribute {name!r}")
@@ -1,65 +1,532 @@
-import boto3
-from functools import lru_cache
-from .config import settings
+import asyncio
+import json
+import tempfile
+import threading
+from collections.abc import Sequence
+from concurrent.futures import Future, ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
+from pathlib import Path
+
+from cachetools import TTLCache
+
+try:
+    import orjson
+except ImportError:  # optional speedup, see the `speedups` extra
+    orjson = None
+
+from .config import get_settings
+from .session import current_session, region as session_region
+
+# Larger keep-alive pool so bursts of tool calls reuse connections
+_MAX_POOL_CONNECTIONS = 50
+
+
+def _orjson_parser_factory():
+    """Response parser factory whose JSON protocols decode bodies with orjson."""
+    from botocore import parsers
+
+    class OrjsonBodyMixin:
+        def _parse_body_as_json(self, body_contents):
+            if not body_contents:
+                return {}
+            try:
+                return orjson.loads(body_contents)
+            except orjson.JSONDecodeError:
+                # Same fallback as botocore: surface the raw body as the message
+                return {"message": body_contents.decode(self.DEFAULT_ENCODING)}
+
+    json_parsers = {
+        protocol: type(parser_cls.__name__, (OrjsonBodyMixin, parser_cls), {})
+        for protocol, parser_cls in parsers.PROTOCOL_PARSERS.items()
+        if issubclass(parser_cls, parsers.BaseJSONParser)
+    }
+
+    class OrjsonParserFactory(parsers.ResponseParserFactory):
+        def create_parser(self, protocol_name):
+            parser_cls = json_parsers.get(protocol_name)
+            if parser_cls is None:
+                return super().create_parser(protocol_name)
+            return parser_cls(**self._defaults)
+
+    return OrjsonParserFactory()
+
+
+@lru_cache(maxsize=1)
+def _get_session():
+    """One session for every client so credentials and config files are resolved once."""
+    # boto3 is imported on first use so importing the tools stays cheap
+    import boto3
+    import botocore.session
+
+    core_session = botocore.session.get_session()
+    if orjson is not None:
+        core_session.register_component("response_parser_factory", _orjson_parser_factory())
+    return boto3.Session(botocore_session=core_session, profile_name=get_settings().aws_profile)
+
+
+@lru_cache(maxsize=1)
+def _get_client_config():
+    """Shared client config: pooled keep-alive connections and adaptive retries."""
+    from botocore.config import Config
+
+    return Config(
+        max_pool_connections=_MAX_POOL_CONNECTIONS,
+        retries={"max_attempts": 5, "mode": "adaptive"},
+        tcp_keepalive=True,
+        connect_timeout=3,
+        read_timeout=30,
+    )
+
+
+@lru_cache(maxsize=1)
+def _get_scan_config():
+    """Fail-fast config for cross-region scans, so one slow region can't hold up the rest."""
+    from botocore.config import Config
+
+    return _get_client_config().merge(
+        Config(
+            connect_timeout=2,
+            read_timeout=5,
+            retries={"total_max_attempts": 2, "mode": "standard"},
+        )
+    )
+
+
+# boto3 sessions are not thread-safe, so client creation is serialized
+_CLIENT_LOCK = threading.Lock()
+
+# Blocking boto3 calls run here, one worker per pooled connection
+_IO_EXECUTOR = ThreadPoolExecutor(
+    max_workers=_MAX_POOL_CONNECTIONS, thread_name_prefix="aws-io"
+)
+
+
+async def run_sync(func, /, *args, **kwargs):
+    """Run a blocking boto3 call on the AWS I/O pool without blocking the event loop."""
+    loop = asyncio.get_running_loop()
+    return await loop.run_in_executor(_IO_EXECUTOR, partial(func, *args, **kwargs))
+
+
+# Lookups in progress, so concurrent callers for the same key share one
+_inflight: dict[tuple, Future] = {}
+_inflight_lock = threading.Lock()
+
+
+def _single_flight(key: tuple, func, *args):
+    """Run func(*args) once for every caller that asks for key while it is running."""
+    with _inflight_lock:
+        future = _inflight.get(key)
+        leader = future is None
+        if leader:
+            future = _inflight[key] = Future()
+    if not leader:
+        return future.result()
+    try:
+        result = func(*args)
+    except BaseException as exc:
+        future.set_exception(exc)
+        raise
+    else:
+        future.set_result(result)
+        return result
+    finally:
+        with _inflight_lock:
+            del _inflight[key]
+
+
+def _keep_alive(request, **kwargs) -> None:
+    """Ask the endpoint to hold the connection open for the next call."""
+    request.headers["Connection"] = "keep-alive"
+
+
+def _drop_response_metadata(parsed, **kwargs) -> None:
+    """Drop HTTP headers, request IDs and retry counts that no tool returns usefully."""
+    parsed.pop("ResponseMetadata", None)
+
+
+# Audit fields Connect adds to most list summaries
+_AUDIT_FIELDS = ("LastModifiedTime", "LastModifiedRegion")
+
+
+def drop_summary_fields(
+    result: dict, list_key: str, fields: Sequence[str] = _AUDIT_FIELDS
+) -> dict:
+    """Remove fields from each summary in a list response, for tools whose listings run long."""
+    for item in result.get(list_key, []):
+        for field in fields:
+            item.pop(field, None)
+    return result
+
+
+_clients: dict[tuple[str, str, bool], object] = {}
+
+
+def _get_client(service_name: str, region: str, scan: bool = False):
+    """Build a client once per (service, region) pair, plus a fail-fast one for scans."""
+    key = (service_name, region, scan)
+    client = _clients.get(key)
+    if client is None:
+        with _CLIENT_LOCK:
+            # Re-check under the lock so racing threads (e.g. warm-up) share one client
+            client = _clients.get(key)
+            if client is None:
+                config = _get_scan_config() if scan else _get_client_config()
+                client = _get_session().client(service_name, region_name=region, config=config)
+                client.meta.events.register("request-created", _keep_alive)
+                client.meta.events.register("after-call", _drop_response_metadata)
+                _clients[key] = client
+    return client
+
+
+def _resolve_region(region: str | None) -> str:
+    """Resolve the region before it becomes part of a client cache key."""
+    return region or session_region() or get_settings().aws_region
 
 
 def get_connect_client(region: str | None = None):
-    """Get Connect client for specified region or default."""
-    return boto3.client("connect", region_name=region or settings.aws_region)
+    """Get Connect client for specified region, session region, or default."""
+    return _get_client("connect", _resolve_region(region))
+
+
+@lru_cache(maxsize=128)
+def _max_page_size(client, operation: str) -> int | None:
+    """Largest MaxResults the operation accepts, per the service model."""
+    operation_model = client.meta.service_model.operation_model(
+        client.meta.method_to_api_mapping[operation]
+    )
+    for name, shape in operation_model.input_shape.members.items():
+        if name.lower() == "maxresults":
+            return shape.metadata.get("max")
+    return None
+
+
+def paginate(
+    client,
+    operation: str,
+    max_items: int | None = None,
+    starting_token: str | None = None,
+    **params,
+) -> dict:
+    """Collect up to max_items results (all, if None) of a paginated operation.
+
+    Pages are requested at the largest size the API allows, so the fewest calls are
+    made. The merged response carries a NextToken when results were truncated; pass
+    it back as starting_token to resume from there.
+    """
+    page_size = _max_page_size(client, operation)
+    if max_items is not None and (page_size is None or max_items < page_size):
+        page_size = max_items
+    pagination = {"MaxItems": max_items, "PageSize": page_size, "StartingToken": starting_token}
+    pages = client.get_paginator(operation).paginate(
+        **params, PaginationConfig={k: v for k, v in pagination.items() if v is not None}
+    )
+    return pages.build_full_result()
+
+
+# Regions that recently failed to connect; cross-region scans skip them for a minute
+_regions_down = TTLCache(maxsize=32, ttl=60)
+_regions_down_lock = threading.Lock()
+
+
+def reachable_regions(regions: Sequence[str]) -> list[str]:
+    """Drop regions that recently failed to connect."""
+    with _regions_down_lock:
+        return [r for r in regions if r not in _regions_down]
+
+
+def unreachable_regions(regions: Sequence[str]) -> list[str]:
+    """Regions that recently failed to connect, which scans are skipping."""
+    with _regions_down_lock:
+        return [r for r in regions if r in _regions_down]
+
+
+def scan_region(region: str, func, *args):
+    """Run func(client, *args) with the region's fail-fast Connect client.
+
+    Connection failures and timeouts mark the region down so later scans skip it
+    instead of waiting out its timeouts again.
+    """
+    from botocore.exceptions import ConnectionError, HTTPClientError
+
+    try:
+        return func(_get_client("connect", region, scan=True), *args)
+    except (ConnectionError, HTTPClientError):
+        with _regions_down_lock:
+            _regions_down[region] = True
+        raise
+
+
+def _instance_exists(instance_id: str, region: str) -> bool:
+    """Check whether the instance lives in the given region."""
+    try:
+        scan_region(region, lambda client: client.describe_instance(InstanceId=instance_id))
+        return True
+    except Exception:
+        return False
+
+
+def _find_instance_region(instance_id: str, regions: Sequence[str]) -> str | None:
+    """Probe regions concurrently and return the first one that owns the instance."""
+    regions = reachable_regions(regions)
+    if not regions:
+        return None
+    executor = ThreadPoolExecutor(max_workers=len(regions))
+    try:
+        futures = {executor.submit(_instance_exists, instance_id, r): r for r in regions}
+        for future in as_completed(futures):
+            if future.result():
+                return futures[future]
+    finally:
+        # Stop waiting on the remaining probes as soon as we have an answer
+        executor.shutdown(wait=False, cancel_futures=True)
+    return None
+
+
+def _list_instance_ids(region: str) -> list[str]:
+    """List every instance ID in a region, or nothing if the region can't be reached."""
+    try:
+        result = scan_region(region, paginate, "list_instances")
+    except Exception:
+        return []
+    return [inst["Id"] for inst in result.get("InstanceSummaryList", [])]
+
+
+def _sweep_instance_regions(regions: Sequence[str]) -> dict[str, str]:
+    """List instances in all regions concurrently and map each instance ID to its region."""
+    regions = reachable_regions(regions)
+    if not regions:
+        return {}
+    with ThreadPoolExecutor(max_workers=len(regions)) as executor:
+        listings = executor.map(_list_instance_ids, regions)
+        return {
+            instance_id: region
+            for region, instance_ids in zip(regions, listings)
+            for instance_id in instance_ids
+        }
+
+
+# Regions where Amazon Connect is available
+CONNECT_REGIONS = (
+    "us-east-1", "us-west-2", "eu-west-2", "eu-central-1", "ap-southeast-1",
+    "ap-southeast-2", "ap-northeast-1", "ap-northeast-2", "ca-central-1", "af-south-1",
+)
+
+# Regions probed before falling back to a full sweep
+_COMMON_REGIONS = ("us-east-1", "us-west-2", "eu-west-1", "ap-southeast-2")
+
+
+def _discover_instance_region(instance_id: str) -> str:
+    """Sweep regions for the instance."""
+    region = _find_instance_region(instance_id, _COMMON_REGIONS)
+    if region:
+        return region
+
+    # Only sweep the remaining Connect regions when the common ones miss. Listing
+    # instances finds every other instance on the way, so they are cached too.
+    probed = set(_COMMON_REGIONS)
+    remaining = [r for r in CONNECT_REGIONS if r not in probed]
+    found = _sweep_instance_regions(remaining)
+    with _instance_regions_lock:
+        _instance_regions.update(found)
+    region = found.get(instance_id)
+    if region:
+        return region
+
+    # A region that was skipped or failed may still hold the instance, so only
+    # report it missing everywhere when every region answered
+    unreachable = unreachable_regions([*_COMMON_REGIONS, *remaining])
+    if unreachable:
+        raise ValueError(
+            f"Instance {instance_id} not found in the reachable regions; could not reach "
+            f"{', '.join(unreachable)}. Try again in a minute"
+        )
+    raise ValueError(f"Instance {instance_id} not found in any region")
+
+
+# Instance -> region lookups persist across restarts so each instance is only swept once
+_REGION_CACHE_FILE = Path.home() / ".cache" / "connect-mcp" / "instance_regions.json"
+
+
+def _load_region_cache() -> dict[str, str]:
+    try:
+        cached = json.loads(_REGION_CACHE_FILE.read_text())
+    except (OSError, ValueError):
+        return {}
+    # Only trust a file that still has the shape _save_region_cache writes
+    if not isinstance(cached, dict) or not all(
+        isinstance(k, str) and isinstance(v, str) for k, v in cached.items()
+    ):
+        return {}
+    return cached
+
+
+def _save_region_cache() -> None:
+    """Write the cached regions to disk. Callers hold _instance_regions_lock."""
+    snapshot = json.dumps(dict(_instance_regions))
+    tmp = None
+    try:
+        _REGION_CACHE_FILE.parent.mkdir(parents=True, exist_ok=True)
+        # A temp file of its own, so a concurrent save (e.g. another server
+        # process) never renames this one while it is half written
+        with tempfile.NamedTemporaryFile(
+            "w", dir=_REGION_CACHE_FILE.parent, suffix=".tmp", delete=False
+        ) as tmp:
+            tmp.write(snapshot)
+        Path(tmp.name).replace(_REGION_CACHE_FILE)
+    except OSError:
+        if tmp is not None:
+            Path(tmp.name).unlink(missing_ok=True)
+
+
+_instance_regions: dict[str, str] = _load_region_cache()
+# Guards changes to _instance_regions and its saves; lookups run on worker threads
+_instance_regions_lock = threading.Lock()
+
+
+def _discover_and_store_region(instance_id: str) -> str:
+    """Discover the instance's region and persist it."""
+    region = _discover_instance_region(instance_id)
+    with _instance_regions_lock:
+        _instance_regions[instance_id] = region
+        _save_region_cache()
+    return region
 
 
 def get_instance_region(instance_id: str) -> str:
     """Get the region where a Connect instance is located."""
-    # Try common regions first
-    common_regions = ["us-east-1", "us-west-2", "eu-west-1", "ap-southeast-2"]
-    
-    for region in common_regions:
-        try:
-            client = get_connect_client(region)
-            client.describe_instance(InstanceId=instance_id)
-            return region
-        except client.exceptions.ResourceNotFoundException:
-            continue
-        except Exception:
-            continue
-    
-    # If not found in common regions, try all regions
-    ec2 = boto3.client('ec2')
-    all_regions = [r['RegionName'] for r in ec2.describe_regions()['Regions']]
-    
-    for region in all_regions:
-        if region in common_regions:
-            continue
-        try:
-            client = get_connect_client(region)
-            client.describe_instance(InstanceId=instance_id)
-            return region
-        except client.exceptions.ResourceNotFoundException:
-            continue
-        except Exception:
-            continue
-    
-    raise ValueError(f"Instance {instance_id} not found in any region")
+    # Trust the session only when set_session named the instance and region together
+    session = current_session()
+    if instance_id == session.instance_id and session.instance_region:
+        return session.instance_region
+    region = _instance_regions.get(instance_id)
+    if region:
+        return region
+    # Callers that arrive during a lookup wait for it; only that lookup stores the result
+    return _single_flight(("instance_region", instance_id), _discover_and_store_region, instance_id)
+
+
+def clear_instance_region_cache(instance_id: str | None = None) -> None:
+    """Forget one instance's region, or every cached region when no ID is given."""
+    with _instance_regions_lock:
+        if instance_id is None:
+            _instance_regions.clear()
+        else:
+            _instance_regions.pop(instance_id, None)
+        _save_region_cache()
+
+
+@lru_cache(maxsize=1)
+def _get_caller_identity() -> tuple[str, str]:
+    """Get the (partition, account) of the configured credentials."""
+    identity = _get_client("sts", get_settings().aws_region).get_caller_identity()
+    return identity["Arn"].split(":")[1], identity["Account"]
+
+
+def get_instance_arn(instance_id: str, region: str) -> str:
+    """Build a Connect instance ARN without a describe_instance round trip."""
+    partition, account = _get_caller_identity()
+    return f"arn:{partition}:connect:{region}:{account}:instance/{instance_id}"
 
 
 def get_cases_client(region: str | None = None):
-    """Get Cases client for specified region or default."""
-    return boto3.client("connectcases", region_name=region or settings.aws_region)
+    """Get Cases client for specified region, session region, or default."""
+    return _get_client("connectcases", _resolve_region(region))
 
 
-@lru_cache
 def get_profiles_client(region: str | None = None):
-    """Get Customer Profiles client for specified region or default."""
-    return boto3.client("customer-profiles", region_name=region or settings.aws_region)
+    """Get Customer Profiles client for specified region, session region, or default."""
+    return _get_client("customer-profiles", _resolve_region(region))
 
 
-@lru_cache
 def get_wisdom_client(region: str | None = None):
-    """Get Amazon Q in Connect client for specified region or default."""
-    return boto3.client("qconnect", region_name=region or settings.aws_region)
+    """Get Amazon Q in Connect client for specified region, session region, or default."""
+    return _get_client("qconnect", _resolve_region(region))
 
 
-@lru_cache
 def get_campaigns_client(region: str | None = None):
-    """Get Connect Campaigns client for specified region or default."""
-    return boto3.client("connectcampaignsv2", region_name=region or settings.aws_region)
+    """Get Connect Campaigns client for specified region, session region, or default."""
+    return _get_client("connectcampaignsv2", _resolve_region(region))
+
+
+@lru_cache(maxsize=1)
+def _queue_ids_cache() -> TTLCache:
+    # The queue set rarely changes between metric polls
+    return TTLCache(maxsize=32, ttl=get_settings().cache_ttl)
+
+
+_queue_ids_lock = threading.Lock()
+
+
+def get_queue_ids(instance_id: str, region: str, queue_type: str | None = None) -> list[str]:
+    """List every queue ID in an instance, or those of one type, reusing a recent result."""
+    key = (instance_id, region, queue_type)
+    with _queue_ids_lock:
+        queue_ids = _queue_ids_cache().get(key)
+    if queue_ids is None:
+        queue_ids = _single_flight(("queue_ids", *key), _fetch_queue_ids, *key)
+    return queue_ids
+
+
+def get_standard_queue_ids(instance_id: str, region: str) -> list[str]:
+    """List every standard queue ID in an instance, reusing a recent result."""
+    return get_queue_ids(instance_id, region, "STANDARD")
+
+
+def _fetch_queue_ids(instance_id: str, region: str, queue_type: str | None) -> list[str]:
+    client = get_connect_client(region)
+    params = {"InstanceId": instance_id}
+    if queue_type:
+        params["QueueTypes"] = [queue_type]
+    queues = paginate(client, "list_queues", **params)
+    queue_ids = [q["Id"] for q in queues.get("QueueSummaryList", [])]
+    if queue_ids:
+        with _queue_ids_lock:
+            _queue_ids_cache()[(instance_id, region, queue_type)] = queue_ids
+    return queue_ids
+
+
+def clear_queue_ids(instance_id: str) -> None:
+    """Forget an instance's cached queue IDs, of every type and in every region."""
+    with _queue_ids_lock:
+        cache = _queue_ids_cache()
+        for key in [key for key in cache if key[0] == instance_id]:
+            del cache[key]
+
+
+# Paginated Connect operations behind the Tier 1 tools
+_WARM_PAGINATORS = ("list_instances", "list_queues", "list_users")
+
+
+def _warm_paginators(client, operations: Sequence[str]) -> None:
+    """Load the paginator model and page sizes that paginate() reads on first use."""
+    for operation in operations:
+        client.get_paginator(operation)
+        _max_page_size(client, operation)
+
+
+def warm_clients(region: str | None = None) -> None:
+    """Build the clients for a region ahead of the first tool call."""
+    for getter in (
+        get_connect_client,
+        get_cases_client,
+        get_profiles_client,
+        get_wisdom_client,
+        get_campaigns_client,
+    ):
+        try:
+            getter(region)
+        except Exception:
+            pass
+    try:
+        _warm_paginators(get_connect_client(region), _WARM_PAGINATORS)
+    except Exception:
+        pass
+
+
+def warm_connect_regions() -> None:
+    """Build the fail-fast Connect client that cross-region scans use in every region."""
+    for region in CONNECT_REGIONS:
+        try:
+            _warm_paginators(_get_client("connect", region, scan=True), ("list_instances",))
+        except Exception:
+            pass
@@ -0,0 +1,74 @@
+"""Short-lived response caching for read-only list and describe tools."""
+import asyncio
+import functools
+import inspect
+
+from cachetools import TTLCache
+
+from .aws_clients import _resolve_region
+
+# Listings and descriptions rarely change mid-session; our own writes invalidate them
+LIST_TTL = 30
+
+_caches: dict[str, TTLCache] = {}
+
+
+def ttl_cache(ttl: float = LIST_TTL, maxsize: int = 128):
+    """Cache an async tool's result per (effective region, arguments).
+
+    The cache namespace is the tool's name, which is what `invalidates` clears.
+    Concurrent misses for the same key share one call instead of each making it.
+    Only the event loop touches these caches, so no locking is needed.
+
+    Every caller gets the cached object itself, not a copy, so results are
+    read-only: a caller that wants to change one must copy it first (as
+    cases_list_layouts does), or the change leaks into later hits.
+    """
+    def decorator(fn):
+        signature = inspect.signature(fn)
+        cache = _caches.setdefault(fn.__name__, TTLCache(maxsize=maxsize, ttl=ttl))
+        inflight: dict[tuple, asyncio.Task] = {}
+
+        async def load(key, args, kwargs):
+            try:
+                result = await fn(*args, **kwargs)
+                cache[key] = result
+                return result
+            finally:
+                del inflight[key]
+
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            bound = signature.bind(*args, **kwargs)
+            bound.apply_defaults()
+            key = (_resolve_region(bound.arguments.get("region")), *bound.arguments.items())
+            try:
+                return cache[key]
+            except KeyError:
+                pass
+            task = inflight.get(key)
+            if task is None:
+                task = inflight[key] = asyncio.ensure_future(load(key, args, kwargs))
+            # One caller giving up must not cancel the call the others are waiting on
+            return await asyncio.shield(task)
+
+        return wrapper
+
+    return decorator
+
+
+def invalidates(*namespaces: str):
+    """Clear the named list caches after the wrapped write tool succeeds."""
+    def decorator(fn):
+        @functools.wraps(fn)
+        async def wrapper(*args, **kwargs):
+            result = await fn(*args, **kwargs)
+            for namespace in namespaces:
+                cache = _caches.get(namespace)
+                if cache is not None:
+                    cache.clear()
+            return result
+
+        return wrapper
+
+    return decorator
@@ -0,0 +1,45 @@
+"""Session defaults shared by the tools and the AWS client helpers."""
+from dataclasses import dataclass, replace
+
+
+@dataclass(frozen=True, slots=True)
+class SessionContext:
+    """Region and instance chosen with set_session."""
+
+    region: str | None = None
+    instance_id: str | None = None
+    # Region given in the same set_session call as instance_id, so known to host it
+    instance_region: str | None = None
+
+
+# Replaced, never mutated, by set_session/clear_session, so a reader holding one
+# snapshot always sees a region and instance_id that were set together
+_current = SessionContext()
+
+
+def current_session() -> SessionContext:
+    """The current session snapshot."""
+    return _current
+
+
+def update_session(**changes: str | None) -> SessionContext:
+    """Swap in a new snapshot with the given fields changed."""
+    global _current
+    _current = replace(_current, **changes)
+    return _current
+
+
+def reset_session() -> None:
+    """Forget the session region and instance."""
+    global _current
+    _current = SessionContext()
+
+
+def region() -> str | None:
+    """Region chosen with set_session, if any."""
+    return _current.region
+
+
+def instance_id() -> str | None:
+    """Instance chosen with set_session, if any."""
+    return _current.instance_id
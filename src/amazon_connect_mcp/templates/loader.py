@@ -1,16 +1,47 @@
 """Template loader utilities for Amazon Connect MCP."""
 
 import json
+from functools import lru_cache
 from pathlib import Path
 from typing import Any
 
+try:
+    import orjson
+except ImportError:  # optional speedup, see the `speedups` extra
+    orjson = None
+
 TEMPLATES_DIR = Path(__file__).parent
 
 
-def list_templates(category: str | None = None) -> list[dict[str, Any]]:
-    """List available templates, optionally filtered by category."""
-    templates = []
-    
+@lru_cache(maxsize=256)
+def load_json(path: Path) -> Any:
+    """Parse a JSON file once. Returns None if it doesn't exist.
+
+    The parsed value is shared by every caller, so treat it as read-only.
+    """
+    if not path.exists():
+        return None
+    data = path.read_bytes()
+    return orjson.loads(data) if orjson else json.loads(data)
+
+
+@lru_cache(maxsize=32)
+def _load_yaml(path: Path) -> Any:
+    """Parse a CloudFormation YAML file once. Returns None if it doesn't exist."""
+    if not path.exists():
+        return None
+    import yaml
+    with open(path) as f:
+        return yaml.load(f, Loader=_get_cfn_yaml_loader())
+
+
+# Global LLM guidance is attached to every JSON template
+_GLOBAL_GUIDANCE = load_json(TEMPLATES_DIR / "_global_guidance.json")
+
+
+@lru_cache(maxsize=1)
+def _template_index() -> dict[str, list[dict[str, Any]]]:
+    """Walk the template directories once; templates ship with the package."""
     categories = {
         "cases": TEMPLATES_DIR / "cases",
         "views": TEMPLATES_DIR / "views",
@@ -26,11 +57,10 @@ def list_templates(category: str | None = None) -> list[dict[str, Any]]:
         "guides": TEMPLATES_DIR / "guides",
     }
     
-    if category:
-        categories = {category: categories.get(category)} if category in categories else {}
-    
+    index = {}
     for cat_name, cat_path in categories.items():
-        if cat_path and cat_path.exists():
+        templates = index[cat_name] = []
+        if cat_path.exists():
             for file_path in cat_path.rglob("*.json"):
                 # Skip guidance files from listing
                 if file_path.stem.startswith("_"):
@@ -49,11 +79,25 @@ def list_templates(category: str | None = None) -> list[dict[str, Any]]:
                     "subcategory": file_path.parent.name if file_path.parent != cat_path else None,
                 })
     
-    return templates
+    return index
+
+
+def list_templates(category: str | None = None) -> list[dict[str, Any]]:
+    """List available templates, optionally filtered by category."""
+    index = _template_index()
+    if category:
+        templates = index.get(category, [])
+    else:
+        templates = [t for cat_templates in index.values() for t in cat_templates]
+    return [dict(t) for t in templates]
 
 
+@lru_cache(maxsize=1)
 def _get_cfn_yaml_loader():
-    """Get a YAML loader that handles CloudFormation intrinsic functions."""
+    """Get a YAML loader that handles CloudFormation intrinsic functions.
+
+    Built once on first use so yaml is only imported when a YAML template is read.
+    """
     import yaml
     
     class CFNLoader(yaml.SafeLoader):
@@ -79,48 +123,44 @@ def _get_cfn_yaml_loader():
 
 
 def get_template(category: str, name: str, subcategory: str | None = None) -> dict[str, Any]:
-    """Load a template by category and name. Includes LLM guidance if available."""
+    """Load a template by category and name. Includes LLM guidance if available.
+
+    Parsed files are cached; the returned dict is fresh but nested values are shared,
+    so treat them as read-only.
+    """
     if subcategory:
         path = TEMPLATES_DIR / category / subcategory / f"{name}.json"
     else:
         path = TEMPLATES_DIR / category / f"{name}.json"
     
-    if not path.exists():
+    template = load_json(path)
+    if template is None:
         # Try yaml
-        yaml_path = path.with_suffix(".yaml")
-        if yaml_path.exists():
-            import yaml
-            with open(yaml_path) as f:
-                return yaml.load(f, Loader=_get_cfn_yaml_loader())
-        raise FileNotFoundError(f"Template not found: {path}")
+        template = _load_yaml(path.with_suffix(".yaml"))
+        if template is None:
+            raise FileNotFoundError(f"Template not found: {path}")
+        return dict(template)
     
-    with open(path) as f:
-        template = json.load(f)
+    template = dict(template)
     
     # Include global LLM guidance (CRITICAL - read first)
-    global_guidance_path = TEMPLATES_DIR / "_global_guidance.json"
-    if global_guidance_path.exists():
-        with open(global_guidance_path) as f:
-            template["_CRITICAL_READ_FIRST"] = json.load(f)
+    if _GLOBAL_GUIDANCE is not None:
+        template["_CRITICAL_READ_FIRST"] = _GLOBAL_GUIDANCE
     
     # Include category-level LLM guidance if available
-    guidance_path = TEMPLATES_DIR / category / "_llm_guidance.json"
-    if guidance_path.exists():
-        with open(guidance_path) as f:
-            guidance = json.load(f)
-            template["_category_guidance"] = guidance
+    guidance = load_json(TEMPLATES_DIR / category / "_llm_guidance.json")
+    if guidance is not None:
+        template["_category_guidance"] = guidance
     
     return template
 
 
 def customize_template(template: dict[str, Any], overrides: dict[str, Any]) -> dict[str, Any]:
-    """Apply customizations to a template."""
-    result = template.copy()
-    
-    for key, value in overrides.items():
-        if key in result and isinstance(result[key], dict) and isinstance(value, dict):
-            result[key] = {**result[key], **value}
-        else:
-            result[key] = value
-    
-    return result
+    """Apply customizations to a template. Dict values are merged one level deep."""
+    merged = {
+        key: {**template[key], **value}
+        if isinstance(value, dict) and isinstance(template.get(key), dict)
+        else value
+        for key, value in overrides.items()
+    }
+    return {**template, **merged}
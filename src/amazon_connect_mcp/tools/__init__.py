@@ -1,5 +1,5 @@
 """Tools package."""
 
-from . import core, cases, contacts, config, analytics, profiles, campaigns, ai, wizard
-
+# Submodules are imported on first use (e.g. `from .tools import cases`) so entry points
+# like the layout visualizer don't pull in boto3 and the full tool set
 __all__ = ["core", "cases", "contacts", "config", "analytics", "profiles", "campaigns", "ai", "wizard"]
@@ -1,16 +1,23 @@
 """Tier 2: Amazon Q in Connect (AI) tools - Defer loaded."""
-from ..aws_clients import get_wisdom_client
-from .config import _session_context
+from ..aws_clients import get_wisdom_client, run_sync
 
-
-def _get_session_region():
-    return _session_context.get("region")
+__all__ = [
+    "ai_list_assistants",
+    "ai_query_assistant",
+    "ai_list_knowledge_bases",
+    "ai_search_content",
+    "ai_get_recommendations",
+    "ai_create_session",
+    "ai_list_quick_responses",
+    "ai_search_quick_responses",
+    "qic_search",
+]
 
 
 async def ai_list_assistants() -> dict:
     """List Amazon Q assistants."""
-    client = get_wisdom_client(_get_session_region())
-    return client.list_assistants()
+    client = get_wisdom_client()
+    return await run_sync(client.list_assistants)
 
 
 async def ai_query_assistant(
@@ -19,8 +26,9 @@ async def ai_query_assistant(
     max_results: int = 10
 ) -> dict:
     """Query an assistant for recommendations."""
-    client = get_wisdom_client(_get_session_region())
-    return client.query_assistant(
+    client = get_wisdom_client()
+    return await run_sync(
+        client.query_assistant,
         assistantId=assistant_id,
         queryText=query_text,
         maxResults=max_results,
@@ -29,8 +37,8 @@ async def ai_query_assistant(
 
 async def ai_list_knowledge_bases(assistant_id: str) -> dict:
     """List knowledge bases for an assistant."""
-    client = get_wisdom_client(_get_session_region())
-    return client.list_knowledge_bases()
+    client = get_wisdom_client()
+    return await run_sync(client.list_knowledge_bases)
 
 
 async def ai_search_content(
@@ -39,9 +47,10 @@ async def ai_search_content(
     max_results: int = 10
 ) -> dict:
     """Search content in a knowledge base by exact name match."""
-    client = get_wisdom_client(_get_session_region())
+    client = get_wisdom_client()
     # Note: Only EQUALS operator is supported for NAME field
-    return client.search_content(
+    return await run_sync(
+        client.search_content,
         knowledgeBaseId=knowledge_base_id,
         searchExpression={
             "filters": [{
@@ -60,8 +69,9 @@ async def ai_get_recommendations(
     max_results: int = 5
 ) -> dict:
     """Get AI recommendations for a session."""
-    client = get_wisdom_client(_get_session_region())
-    return client.get_recommendations(
+    client = get_wisdom_client()
+    return await run_sync(
+        client.get_recommendations,
         assistantId=assistant_id,
         sessionId=session_id,
         maxResults=max_results,
@@ -73,14 +83,18 @@ async def ai_create_session(
     name: str
 ) -> dict:
     """Create an AI session."""
-    client = get_wisdom_client(_get_session_region())
-    return client.create_session(assistantId=assistant_id, name=name)
+    client = get_wisdom_client()
+    return await run_sync(client.create_session, assistantId=assistant_id, name=name)
 
 
 async def ai_list_quick_responses(knowledge_base_id: str, max_results: int = 25) -> dict:
     """List quick responses."""
-    client = get_wisdom_client(_get_session_region())
-    return client.list_quick_responses(knowledgeBaseId=knowledge_base_id, maxResults=max_results)
+    client = get_wisdom_client()
+    return await run_sync(
+        client.list_quick_responses,
+        knowledgeBaseId=knowledge_base_id,
+        maxResults=max_results,
+    )
 
 
 async def ai_search_quick_responses(
@@ -89,8 +103,9 @@ async def ai_search_quick_responses(
     max_results: int = 10
 ) -> dict:
     """Search quick responses."""
-    client = get_wisdom_client(_get_session_region())
-    return client.search_quick_responses(
+    client = get_wisdom_client()
+    return await run_sync(
+        client.search_quick_responses,
         knowledgeBaseId=knowledge_base_id,
         searchExpression={
             "queries": [{
@@ -108,17 +123,18 @@ async def qic_search(query: str, max_results: int = 5) -> dict:
     
     Auto-discovers the first available assistant and searches its knowledge base.
     """
-    client = get_wisdom_client(_get_session_region())
+    client = get_wisdom_client()
     
     # Auto-discover assistant
-    assistants = client.list_assistants()
+    assistants = await run_sync(client.list_assistants)
     if not assistants.get("assistantSummaries"):
         return {"error": "No Amazon Q assistants found. Create one in the Connect console first."}
     
     assistant_id = assistants["assistantSummaries"][0]["assistantId"]
     
     # Query the assistant
-    results = client.query_assistant(
+    results = await run_sync(
+        client.query_assistant,
         assistantId=assistant_id,
         queryText=query,
         maxResults=max_results,
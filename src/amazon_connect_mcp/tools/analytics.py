@@ -1,10 +1,31 @@
 """Tier 2: Analytics tools - Defer loaded."""
-from ..aws_clients import get_connect_client
-from .config import _session_context
+import asyncio
 
+from ..aws_clients import get_connect_client, get_instance_arn, get_standard_queue_ids, run_sync
 
-def _get_session_region():
-    return _session_context.get("region")
+__all__ = [
+    "analytics_get_metric_data",
+    "analytics_get_current_user_data",
+    "analytics_list_contact_evaluations",
+    "analytics_start_contact_evaluation",
+    "analytics_list_evaluation_forms",
+]
+
+
+# GetMetricDataV2 takes at most 100 values per filter
+_MAX_FILTER_VALUES = 100
+
+
+def _get_queue_metric_data(client, queue_ids: list[str], **params) -> list[dict]:
+    """Every page of get_metric_data_v2 results for one group of queues."""
+    params["Filters"] = [{"FilterKey": "QUEUE", "FilterValues": queue_ids}]
+    results = []
+    while True:
+        response = client.get_metric_data_v2(**params)
+        results.extend(response.get("MetricResults", []))
+        if not response.get("NextToken"):
+            return results
+        params["NextToken"] = response["NextToken"]
 
 
 async def analytics_get_metric_data(
@@ -14,20 +35,20 @@ async def analytics_get_metric_data(
     queue_ids: list[str] | None = None,
     metrics: list[str] | None = None
 ) -> dict:
-    """Get historical metrics (ISO 8601 timestamps)."""
-    client = get_connect_client(_get_session_region())
-    region = _get_session_region() or "us-east-1"
-    
-    # Build filters - Queues filter is required
-    filters = {"FilterKey": "QUEUE", "FilterValues": queue_ids or []}
+    """Get historical metrics (ISO 8601 timestamps).
+
+    Up to 100 queues are reported together. More are queried in groups of 100
+    and reported per queue, as one combined figure can cover at most 100 queues.
+    """
+    client = get_connect_client()
     
-    # If no queue_ids provided, get all queues first
+    # Queues filter is required; if no queue_ids provided, use all standard queues
     if not queue_ids:
-        queues_response = client.list_queues(InstanceId=instance_id, QueueTypes=["STANDARD"])
-        queue_ids = [q["Id"] for q in queues_response.get("QueueSummaryList", [])]
-        filters["FilterValues"] = queue_ids
+        queue_ids = await run_sync(
+            get_standard_queue_ids, instance_id, client.meta.region_name
+        )
     
-    if not filters["FilterValues"]:
+    if not queue_ids:
         return {"error": "No queues found", "MetricResults": []}
     
     metric_list = metrics or [
@@ -37,17 +58,29 @@ async def analytics_get_metric_data(
         "AVG_HANDLE_TIME",
     ]
     
-    # Get instance ARN for proper resource reference
-    instance_info = client.describe_instance(InstanceId=instance_id)
-    instance_arn = instance_info["Instance"]["Arn"]
-    
-    return client.get_metric_data_v2(
-        ResourceArn=instance_arn,
-        StartTime=start_time,
-        EndTime=end_time,
-        Filters=[filters],
-        Metrics=[{"Name": m} for m in metric_list],
+    # Instance ARN for proper resource reference, in the client's region
+    instance_arn = await run_sync(
+        get_instance_arn, instance_id, client.meta.region_name
     )
+    
+    params = {
+        "ResourceArn": instance_arn,
+        "StartTime": start_time,
+        "EndTime": end_time,
+        "Metrics": [{"Name": m} for m in metric_list],
+    }
+    # Query the queues in groups the filter accepts and merge the results. Each
+    # call would otherwise combine its own group, so split results are per queue
+    groups = [
+        queue_ids[start:start + _MAX_FILTER_VALUES]
+        for start in range(0, len(queue_ids), _MAX_FILTER_VALUES)
+    ]
+    if len(groups) > 1:
+        params["Groupings"] = ["QUEUE"]
+    group_results = await asyncio.gather(*(
+        run_sync(_get_queue_metric_data, client, group, **params) for group in groups
+    ))
+    return {"MetricResults": [result for results in group_results for result in results]}
 
 
 async def analytics_get_current_user_data(
@@ -55,11 +88,15 @@ async def analytics_get_current_user_data(
     queue_ids: list[str] | None = None
 ) -> dict:
     """Get real-time agent data."""
-    client = get_connect_client(_get_session_region())
+    client = get_connect_client()
     filters = {}
     if queue_ids:
         filters["Queues"] = queue_ids
-    return client.get_current_user_data(InstanceId=instance_id, Filters=filters)
+    return await run_sync(
+        client.get_current_user_data,
+        InstanceId=instance_id,
+        Filters=filters,
+    )
 
 
 async def analytics_list_contact_evaluations(
@@ -67,8 +104,12 @@ async def analytics_list_contact_evaluations(
     contact_id: str
 ) -> dict:
     """List evaluations for a contact."""
-    client = get_connect_client(_get_session_region())
-    return client.list_contact_evaluations(InstanceId=instance_id, ContactId=contact_id)
+    client = get_connect_client()
+    return await run_sync(
+        client.list_contact_evaluations,
+        InstanceId=instance_id,
+        ContactId=contact_id,
+    )
 
 
 async def analytics_start_contact_evaluation(
@@ -77,8 +118,9 @@ async def analytics_start_contact_evaluation(
     evaluation_form_id: str
 ) -> dict:
     """Start an evaluation for a contact."""
-    client = get_connect_client(_get_session_region())
-    return client.start_contact_evaluation(
+    client = get_connect_client()
+    return await run_sync(
+        client.start_contact_evaluation,
         InstanceId=instance_id,
         ContactId=contact_id,
         EvaluationFormId=evaluation_form_id,
@@ -87,5 +129,9 @@ async def analytics_start_contact_evaluation(
 
 async def analytics_list_evaluation_forms(instance_id: str, max_results: int = 25) -> dict:
     """List evaluation forms."""
-    client = get_connect_client(_get_session_region())
-    return client.list_evaluation_forms(InstanceId=instance_id, MaxResults=max_results)
+    client = get_connect_client()
+    return await run_sync(
+        client.list_evaluation_forms,
+        InstanceId=instance_id,
+        MaxResults=max_results,
+    )
@@ -1,10 +1,21 @@
 """Tier 2: Outbound Campaigns tools - Defer loaded."""
-from ..aws_clients import get_campaigns_client
-from .config import _session_context
-
-
-def _get_session_region():
-    return _session_context.get("region")
+from ..aws_clients import get_campaigns_client, run_sync
+
+__all__ = [
+    "campaigns_create",
+    "campaigns_list",
+    "campaigns_describe",
+    "campaigns_start",
+    "campaigns_pause",
+    "campaigns_resume",
+    "campaigns_stop",
+    "campaigns_delete",
+    "campaigns_get_state",
+    "campaigns_put_outbound_requests",
+    "campaigns_start_onboarding",
+    "campaigns_get_onboarding_status",
+    "campaigns_delete_onboarding",
+]
 
 
 async def campaigns_create(
@@ -13,8 +24,9 @@ async def campaigns_create(
     channel_subtype_config: dict
 ) -> dict:
     """Create an outbound campaign."""
-    client = get_campaigns_client(_get_session_region())
-    return client.create_campaign(
+    client = get_campaigns_client()
+    return await run_sync(
+        client.create_campaign,
         name=name,
         connectInstanceId=connect_instance_id,
         channelSubtypeConfig=channel_subtype_config,
@@ -23,53 +35,38 @@ async def campaigns_create(
 
 async def campaigns_list(connect_instance_id: str, max_results: int = 25) -> dict:
     """List outbound campaigns."""
-    client = get_campaigns_client(_get_session_region())
-    return client.list_campaigns(
+    client = get_campaigns_client()
+    return await run_sync(
+        client.list_campaigns,
         filters={"instanceIdFilter": {"value": connect_instance_id, "operator": "Eq"}},
         maxResults=max_results,
     )
 
 
-async def campaigns_describe(campaign_id: str) -> dict:
-    """Get campaign details."""
-    client = get_campaigns_client(_get_session_region())
-    return client.describe_campaign(id=campaign_id)
-
-
-async def campaigns_start(campaign_id: str) -> dict:
-    """Start a campaign."""
-    client = get_campaigns_client(_get_session_region())
-    return client.start_campaign(id=campaign_id)
-
-
-async def campaigns_pause(campaign_id: str) -> dict:
-    """Pause a campaign."""
-    client = get_campaigns_client(_get_session_region())
-    return client.pause_campaign(id=campaign_id)
-
-
-async def campaigns_resume(campaign_id: str) -> dict:
-    """Resume a paused campaign."""
-    client = get_campaigns_client(_get_session_region())
-    return client.resume_campaign(id=campaign_id)
+def _campaign_tool(name: str, operation: str, doc: str):
+    """Build a tool that runs a campaign operation taking only the campaign id."""
+    async def tool(campaign_id: str) -> dict:
+        client = get_campaigns_client()
+        return await run_sync(getattr(client, operation), id=campaign_id)
 
+    tool.__name__ = tool.__qualname__ = name
+    tool.__doc__ = doc
+    return tool
 
-async def campaigns_stop(campaign_id: str) -> dict:
-    """Stop a campaign."""
-    client = get_campaigns_client(_get_session_region())
-    return client.stop_campaign(id=campaign_id)
 
-
-async def campaigns_delete(campaign_id: str) -> dict:
-    """Delete a campaign."""
-    client = get_campaigns_client(_get_session_region())
-    return client.delete_campaign(id=campaign_id)
-
-
-async def campaigns_get_state(campaign_id: str) -> dict:
-    """Get campaign state."""
-    client = get_campaigns_client(_get_session_region())
-    return client.get_campaign_state(id=campaign_id)
+campaigns_describe = _campaign_tool(
+    "campaigns_describe", "describe_campaign", "Get campaign details."
+)
+campaigns_start = _campaign_tool("campaigns_start", "start_campaign", "Start a campaign.")
+campaigns_pause = _campaign_tool("campaigns_pause", "pause_campaign", "Pause a campaign.")
+campaigns_resume = _campaign_tool(
+    "campaigns_resume", "resume_campaign", "Resume a paused campaign."
+)
+campaigns_stop = _campaign_tool("campaigns_stop", "stop_campaign", "Stop a campaign.")
+campaigns_delete = _campaign_tool("campaigns_delete", "delete_campaign", "Delete a campaign.")
+campaigns_get_state = _campaign_tool(
+    "campaigns_get_state", "get_campaign_state", "Get campaign state."
+)
 
 
 async def campaigns_put_outbound_requests(
@@ -77,8 +74,9 @@ async def campaigns_put_outbound_requests(
     outbound_requests: list[dict]
 ) -> dict:
     """Add contacts to dial list."""
-    client = get_campaigns_client(_get_session_region())
-    return client.put_outbound_request_batch(
+    client = get_campaigns_client()
+    return await run_sync(
+        client.put_outbound_request_batch,
         id=campaign_id,
         outboundRequests=outbound_requests,
     )
@@ -92,12 +90,13 @@ async def campaigns_start_onboarding(connect_instance_id: str, encryption_enable
         encryption_enabled: Whether to enable encryption (default False)
         encryption_key_arn: KMS key ARN if encryption is enabled
     """
-    client = get_campaigns_client(_get_session_region())
+    client = get_campaigns_client()
     encryption_config = {"enabled": encryption_enabled}
     if encryption_enabled and encryption_key_arn:
         encryption_config["encryptionType"] = "KMS"
         encryption_config["keyArn"] = encryption_key_arn
-    return client.start_instance_onboarding_job(
+    return await run_sync(
+        client.start_instance_onboarding_job,
         connectInstanceId=connect_instance_id,
         encryptionConfig=encryption_config
     )
@@ -105,11 +104,17 @@ async def campaigns_start_onboarding(connect_instance_id: str, encryption_enable
 
 async def campaigns_get_onboarding_status(connect_instance_id: str) -> dict:
     """Get instance onboarding status for outbound campaigns."""
-    client = get_campaigns_client(_get_session_region())
-    return client.get_instance_onboarding_job_status(connectInstanceId=connect_instance_id)
+    client = get_campaigns_client()
+    return await run_sync(
+        client.get_instance_onboarding_job_status,
+        connectInstanceId=connect_instance_id,
+    )
 
 
 async def campaigns_delete_onboarding(connect_instance_id: str) -> dict:
     """Delete instance onboarding job (to retry onboarding)."""
-    client = get_campaigns_client(_get_session_region())
-    return client.delete_instance_onboarding_job(connectInstanceId=connect_instance_id)
+    client = get_campaigns_client()
+    return await run_sync(
+        client.delete_instance_onboarding_job,
+        connectInstanceId=connect_instance_id,
+    )
@@ -1,17 +1,36 @@
 """Tier 2: Cases tools - Defer loaded."""
-from ..aws_clients import get_cases_client, get_connect_client
-from .config import _session_context
-
-
-def _get_session_region():
-    return _session_context.get("region")
-
-
-def _get_session_instance():
-    return _session_context.get("instance_id")
+from ..aws_clients import get_cases_client, get_connect_client, run_sync
+from ..cache import invalidates, ttl_cache
+from ..session import current_session
+
+__all__ = [
+    "cases_create_template",
+    "cases_list_templates",
+    "cases_get_template",
+    "cases_update_template",
+    "cases_create_field",
+    "cases_list_fields",
+    "cases_update_field",
+    "cases_create_layout",
+    "cases_list_layouts",
+    "cases_update_case",
+    "cases_delete_case",
+    "cases_create_related_item",
+    "cases_list_cases_for_contact",
+    "cases_create_domain",
+    "cases_list_domains",
+    "cases_get_domain",
+    "cases_associate_domain",
+]
+
+
+def _string_fields(fields: dict[str, str]) -> list[dict]:
+    """Convert {field_id: text} into the Cases API field value list."""
+    return [{"id": k, "value": {"stringValue": v}} for k, v in fields.items()]
 
 
 # Case Templates
+@invalidates("cases_list_templates")
 async def cases_create_template(
     domain_id: str,
     name: str,
@@ -19,25 +38,31 @@ async def cases_create_template(
     required_fields: list[str] | None = None
 ) -> dict:
     """Create a case template."""
-    client = get_cases_client(_get_session_region())
+    client = get_cases_client()
     params = {"domainId": domain_id, "name": name, "description": description}
     if required_fields:
         params["requiredFields"] = [{"fieldId": f} for f in required_fields]
-    return client.create_template(**params)
+    return await run_sync(client.create_template, **params)
 
 
+@ttl_cache()
 async def cases_list_templates(domain_id: str, max_results: int = 25) -> dict:
     """List case templates."""
-    client = get_cases_client(_get_session_region())
-    return client.list_templates(domainId=domain_id, maxResults=max_results)
+    client = get_cases_client()
+    return await run_sync(
+        client.list_templates,
+        domainId=domain_id,
+        maxResults=max_results,
+    )
 
 
 async def cases_get_template(domain_id: str, template_id: str) -> dict:
     """Get case template details."""
-    client = get_cases_client(_get_session_region())
-    return client.get_template(domainId=domain_id, templateId=template_id)
+    client = get_cases_client()
+    return await run_sync(client.get_template, domainId=domain_id, templateId=template_id)
 
 
+@invalidates("cases_list_templates")
 async def cases_update_template(
     domain_id: str,
     template_id: str,
@@ -45,16 +70,17 @@ async def cases_update_template(
     description: str | None = None
 ) -> dict:
     """Update a case template."""
-    client = get_cases_client(_get_session_region())
+    client = get_cases_client()
     params = {"domainId": domain_id, "templateId": template_id}
     if name:
         params["name"] = name
     if description:
         params["description"] = description
-    return client.update_template(**params)
+    return await run_sync(client.update_template, **params)
 
 
 # Case Fields
+@invalidates("cases_list_fields")
 async def cases_create_field(
     domain_id: str,
     name: str,
@@ -62,8 +88,9 @@ async def cases_create_field(
     description: str = ""
 ) -> dict:
     """Create a custom field. Types: Text, Number, Boolean, DateTime, SingleSelect, Url."""
-    client = get_cases_client(_get_session_region())
-    return client.create_field(
+    client = get_cases_client()
+    return await run_sync(
+        client.create_field,
         domainId=domain_id,
         name=name,
         type=field_type,
@@ -71,12 +98,14 @@ async def cases_create_field(
     )
 
 
+@ttl_cache()
 async def cases_list_fields(domain_id: str, max_results: int = 25) -> dict:
     """List case fields."""
-    client = get_cases_client(_get_session_region())
-    return client.list_fields(domainId=domain_id, maxResults=max_results)
+    client = get_cases_client()
+    return await run_sync(client.list_fields, domainId=domain_id, maxResults=max_results)
 
 
+@invalidates("cases_list_fields")
 async def cases_update_field(
     domain_id: str,
     field_id: str,
@@ -84,16 +113,23 @@ async def cases_update_field(
     description: str | None = None
 ) -> dict:
     """Update a case field."""
-    client = get_cases_client(_get_session_region())
+    client = get_cases_client()
     params = {"domainId": domain_id, "fieldId": field_id}
     if name:
         params["name"] = name
     if description:
         params["description"] = description
-    return client.update_field(**params)
+    return await run_sync(client.update_field, **params)
 
 
 # Case Layouts
+_CREATE_LAYOUT_TIP = "Use `layout_visualizer` tool to design layouts visually with drag-and-drop"
+_LIST_LAYOUTS_TIP = (
+    "Use `layout_visualizer` tool to design new layouts visually with drag-and-drop"
+)
+
+
+@invalidates("cases_list_layouts")
 async def cases_create_layout(
     domain_id: str,
     name: str,
@@ -104,21 +140,31 @@ async def cases_create_layout(
     💡 TIP: Use the `layout_visualizer` tool to design layouts visually with drag-and-drop!
     It generates the correct JSON structure for you.
     """
-    client = get_cases_client(_get_session_region())
-    result = client.create_layout(domainId=domain_id, name=name, content=content)
-    result["_tip"] = "Use `layout_visualizer` tool to design layouts visually with drag-and-drop"
+    client = get_cases_client()
+    result = await run_sync(
+        client.create_layout,
+        domainId=domain_id,
+        name=name,
+        content=content,
+    )
+    result["_tip"] = _CREATE_LAYOUT_TIP
     return result
 
 
+@ttl_cache()
 async def cases_list_layouts(domain_id: str, max_results: int = 25) -> dict:
     """List case layouts.
     
     💡 TIP: Use the `layout_visualizer` tool to design new layouts visually!
     """
-    client = get_cases_client(_get_session_region())
-    result = client.list_layouts(domainId=domain_id, maxResults=max_results)
-    result["_tip"] = "Use `layout_visualizer` tool to design new layouts visually with drag-and-drop"
-    return result
+    client = get_cases_client()
+    result = await run_sync(
+        client.list_layouts,
+        domainId=domain_id,
+        maxResults=max_results,
+    )
+    # The listing is cached, so add the tip to a copy rather than the shared response
+    return {**result, "_tip": _LIST_LAYOUTS_TIP}
 
 
 # Case Operations
@@ -128,18 +174,19 @@ async def cases_update_case(
     fields: dict[str, str]
 ) -> dict:
     """Update case fields (including status, assignment, etc.)."""
-    client = get_cases_client(_get_session_region())
-    return client.update_case(
+    client = get_cases_client()
+    return await run_sync(
+        client.update_case,
         domainId=domain_id,
         caseId=case_id,
-        fields=[{"id": k, "value": {"stringValue": v}} for k, v in fields.items()],
+        fields=_string_fields(fields),
     )
 
 
 async def cases_delete_case(domain_id: str, case_id: str) -> dict:
     """Delete a case."""
-    client = get_cases_client(_get_session_region())
-    return client.delete_case(domainId=domain_id, caseId=case_id)
+    client = get_cases_client()
+    return await run_sync(client.delete_case, domainId=domain_id, caseId=case_id)
 
 
 async def cases_create_related_item(
@@ -149,8 +196,9 @@ async def cases_create_related_item(
     content: dict
 ) -> dict:
     """Create a related item (contact, comment) for a case."""
-    client = get_cases_client(_get_session_region())
-    return client.create_related_item(
+    client = get_cases_client()
+    return await run_sync(
+        client.create_related_item,
         domainId=domain_id,
         caseId=case_id,
         type=item_type,
@@ -164,46 +212,69 @@ async def cases_list_cases_for_contact(
     max_results: int = 25
 ) -> dict:
     """List cases linked to a contact."""
-    client = get_cases_client(_get_session_region())
+    client = get_cases_client()
     params = {
         "domainId": domain_id,
         "contactArn": contact_arn,
     }
     if max_results and max_results != 25:
         params["maxResults"] = max_results
-    return client.list_cases_for_contact(**params)
+    return await run_sync(client.list_cases_for_contact, **params)
 
 
 # Case Domains
+
+# Static guidance is built once and shared; responses only reference it
+_DOMAIN_ASSOCIATION_ORDER = [
+    "1. Customer Profiles domain must be associated FIRST (profiles_associate_domain)",
+    "2. Then associate Cases domain (cases_associate_domain)",
+    "Cases will NOT work properly without Customer Profiles integration"
+]
+_ASSOCIATED_GUIDANCE = {
+    "status": "Cases domain associated successfully",
+    "whatThisDoes": "Agents can now create and manage cases in the Connect workspace",
+    "prerequisite": "Customer Profiles must have been associated first for full functionality",
+    "nextSteps": [
+        "Create case templates with cases_create_template",
+        "Create custom fields with cases_create_field",
+        "Create layouts with cases_create_layout (or use layout_visualizer)"
+    ]
+}
+
+# Domain IDs never change their ARN, so lookups are kept for the life of the process
+_domain_arns: dict[str, str] = {}
+
+
+@invalidates("cases_list_domains")
 async def cases_create_domain(name: str) -> dict:
     """Create a case domain."""
-    client = get_cases_client(_get_session_region())
-    result = client.create_domain(name=name)
+    client = get_cases_client()
+    result = await run_sync(client.create_domain, name=name)
+    _domain_arns[result["domainId"]] = result["domainArn"]
     result["_llm_guidance"] = {
         "nextStep": {
             "description": "Associate this Cases domain with your Connect instance",
             "tool": "cases_associate_domain",
             "params": {"domain_id": result.get("domainId")}
         },
-        "CRITICAL_ORDER": [
-            "1. Customer Profiles domain must be associated FIRST (profiles_associate_domain)",
-            "2. Then associate Cases domain (cases_associate_domain)",
-            "Cases will NOT work properly without Customer Profiles integration"
-        ]
+        "CRITICAL_ORDER": _DOMAIN_ASSOCIATION_ORDER,
     }
     return result
 
 
+@ttl_cache()
 async def cases_list_domains(max_results: int = 10, region: str | None = None) -> dict:
     """List case domains."""
-    client = get_cases_client(region or _get_session_region())
-    return client.list_domains(maxResults=min(max_results, 10))
+    client = get_cases_client(region)
+    return await run_sync(client.list_domains, maxResults=min(max_results, 10))
 
 
 async def cases_get_domain(domain_id: str, region: str | None = None) -> dict:
     """Get case domain details."""
-    client = get_cases_client(region or _get_session_region())
-    return client.get_domain(domainId=domain_id)
+    client = get_cases_client(region)
+    result = await run_sync(client.get_domain, domainId=domain_id)
+    _domain_arns[domain_id] = result["domainArn"]
+    return result
 
 
 async def cases_associate_domain(
@@ -229,8 +300,9 @@ async def cases_associate_domain(
     
     If you skip step 1, Cases will show a permissions error in the console.
     """
-    region = _get_session_region()
-    effective_instance_id = instance_id or _get_session_instance()
+    session = current_session()
+    region = session.region
+    effective_instance_id = instance_id or session.instance_id
     
     if not effective_instance_id:
         return {
@@ -244,28 +316,21 @@ async def cases_associate_domain(
             "action": "Call set_session(instance_id, region) first"
         }
     
-    # Get account ID from domain ARN
-    cases_client = get_cases_client(region)
-    domain_info = cases_client.get_domain(domainId=domain_id)
-    domain_arn = domain_info["domainArn"]
+    domain_arn = _domain_arns.get(domain_id)
+    if domain_arn is None:
+        cases_client = get_cases_client(region)
+        domain_info = await run_sync(cases_client.get_domain, domainId=domain_id)
+        domain_arn = _domain_arns[domain_id] = domain_info["domainArn"]
     
     # Create the integration association
     connect_client = get_connect_client(region)
-    result = connect_client.create_integration_association(
+    result = await run_sync(
+        connect_client.create_integration_association,
         InstanceId=effective_instance_id,
         IntegrationType="CASES_DOMAIN",
         IntegrationArn=domain_arn
     )
     
-    result["_llm_guidance"] = {
-        "status": "Cases domain associated successfully",
-        "whatThisDoes": "Agents can now create and manage cases in the Connect workspace",
-        "prerequisite": "Customer Profiles must have been associated first for full functionality",
-        "nextSteps": [
-            "Create case templates with cases_create_template",
-            "Create custom fields with cases_create_field",
-            "Create layouts with cases_create_layout (or use layout_visualizer)"
-        ]
-    }
+    result["_llm_guidance"] = _ASSOCIATED_GUIDANCE
     
     return result
@@ -1,28 +1,60 @@
 """Tier 2: Configuration tools - Defer loaded."""
-from ..aws_clients import get_connect_client
-
-# Session context for region - can be set by set_session tool
-_session_context = {
-    "region": None,
-    "instance_id": None
-}
-
-
-def _get_client(region: str | None = None):
-    """Get client using provided region, session context, or default."""
-    effective_region = region or _session_context.get("region")
-    return get_connect_client(effective_region)
+import asyncio
+import threading
+
+from ..aws_clients import (
+    clear_queue_ids,
+    drop_summary_fields,
+    get_connect_client,
+    get_instance_arn,
+    paginate,
+    run_sync,
+    warm_clients,
+)
+from ..cache import invalidates, ttl_cache
+from ..session import SessionContext, current_session, reset_session, update_session
+
+__all__ = [
+    "set_session",
+    "get_session",
+    "clear_session",
+    "config_list_contact_flows",
+    "config_describe_contact_flow",
+    "config_create_contact_flow",
+    "config_update_contact_flow_content",
+    "config_create_queue",
+    "config_describe_queue",
+    "config_update_queue_status",
+    "config_list_phone_numbers",
+    "config_list_routing_profiles",
+    "config_create_routing_profile",
+    "config_list_hours_of_operations",
+    "config_create_hours_of_operation",
+    "config_list_users",
+    "config_list_security_profiles",
+    "config_describe_user",
+    "config_create_user",
+    "config_bulk_create_users",
+    "config_update_user_routing_profile",
+    "config_list_agent_statuses",
+    "config_put_user_status",
+]
 
 
 def _get_instance(instance_id: str | None = None) -> str:
     """Get instance ID from parameter or session context."""
-    effective_id = instance_id or _session_context.get("instance_id")
+    effective_id = instance_id or current_session().instance_id
     if not effective_id:
         raise ValueError("instance_id required - provide it or use set_session first")
     return effective_id
 
 
 # Session Management
+def _session_dict(session: SessionContext) -> dict:
+    """The session defaults as shown to the user."""
+    return {"region": session.region, "instance_id": session.instance_id}
+
+
 async def set_session(
     instance_id: str | None = None,
     region: str | None = None
@@ -37,49 +69,66 @@ async def set_session(
     
     Returns current session context.
     """
+    updates = {}
     if instance_id:
-        _session_context["instance_id"] = instance_id
+        # A region given with the instance is where it lives; without one, it is unknown
+        updates["instance_id"] = instance_id
+        updates["instance_region"] = region
     if region:
-        _session_context["region"] = region
+        updates["region"] = region
+    # One swap so readers never see the new instance paired with the old region
+    session = update_session(**updates)
+    if region:
+        # Build the new region's clients before the next tool call needs them
+        threading.Thread(target=warm_clients, args=(region,), daemon=True).start()
     return {
-        "session": _session_context.copy(),
+        "session": _session_dict(session),
         "message": "Session context updated. All subsequent config operations will use these defaults."
     }
 
 
 async def get_session() -> dict:
     """Get current session context."""
-    return {"session": _session_context.copy()}
+    return {"session": _session_dict(current_session())}
 
 
 async def clear_session() -> dict:
     """Clear session context."""
-    _session_context["region"] = None
-    _session_context["instance_id"] = None
+    reset_session()
     return {"message": "Session context cleared"}
 
 
 # Contact Flows
+@ttl_cache()
 async def config_list_contact_flows(
     instance_id: str,
     max_results: int = 100,
-    region: str | None = None
+    region: str | None = None,
+    next_token: str | None = None
 ) -> dict:
     """List contact flows."""
-    client = _get_client(region)
-    return client.list_contact_flows(InstanceId=instance_id, MaxResults=max_results)
+    client = get_connect_client(region)
+    return await run_sync(
+        paginate, client, "list_contact_flows", max_results, next_token, InstanceId=instance_id
+    )
 
 
+@ttl_cache()
 async def config_describe_contact_flow(
     instance_id: str,
     contact_flow_id: str,
     region: str | None = None
 ) -> dict:
     """Get contact flow details."""
-    client = _get_client(region)
-    return client.describe_contact_flow(InstanceId=instance_id, ContactFlowId=contact_flow_id)
+    client = get_connect_client(region)
+    return await run_sync(
+        client.describe_contact_flow,
+        InstanceId=instance_id,
+        ContactFlowId=contact_flow_id,
+    )
 
 
+@invalidates("config_list_contact_flows")
 async def config_create_contact_flow(
     name: str,
     flow_type: str,
@@ -89,9 +138,10 @@ async def config_create_contact_flow(
     region: str | None = None
 ) -> dict:
     """Create a contact flow. Types: CONTACT_FLOW, CUSTOMER_QUEUE, CUSTOMER_HOLD, etc."""
-    client = _get_client(region)
+    client = get_connect_client(region)
     effective_instance_id = _get_instance(instance_id)
-    return client.create_contact_flow(
+    return await run_sync(
+        client.create_contact_flow,
         InstanceId=effective_instance_id,
         Name=name,
         Type=flow_type,
@@ -100,6 +150,7 @@ async def config_create_contact_flow(
     )
 
 
+@invalidates("config_describe_contact_flow")
 async def config_update_contact_flow_content(
     instance_id: str,
     contact_flow_id: str,
@@ -107,8 +158,9 @@ async def config_update_contact_flow_content(
     region: str | None = None
 ) -> dict:
     """Update contact flow content."""
-    client = _get_client(region)
-    return client.update_contact_flow_content(
+    client = get_connect_client(region)
+    return await run_sync(
+        client.update_contact_flow_content,
         InstanceId=instance_id,
         ContactFlowId=contact_flow_id,
         Content=content,
@@ -124,26 +176,32 @@ async def config_create_queue(
     region: str | None = None
 ) -> dict:
     """Create a queue."""
-    client = _get_client(region)
+    client = get_connect_client(region)
     effective_instance_id = _get_instance(instance_id)
-    return client.create_queue(
+    result = await run_sync(
+        client.create_queue,
         InstanceId=effective_instance_id,
         Name=name,
         HoursOfOperationId=hours_of_operation_id,
         Description=description,
     )
+    # Default metric queries should include the new queue right away
+    clear_queue_ids(effective_instance_id)
+    return result
 
 
+@ttl_cache()
 async def config_describe_queue(
     instance_id: str,
     queue_id: str,
     region: str | None = None
 ) -> dict:
     """Get queue details."""
-    client = _get_client(region)
-    return client.describe_queue(InstanceId=instance_id, QueueId=queue_id)
+    client = get_connect_client(region)
+    return await run_sync(client.describe_queue, InstanceId=instance_id, QueueId=queue_id)
 
 
+@invalidates("config_describe_queue")
 async def config_update_queue_status(
     instance_id: str,
     queue_id: str,
@@ -151,35 +209,53 @@ async def config_update_queue_status(
     region: str | None = None
 ) -> dict:
     """Update queue status. Status: ENABLED or DISABLED."""
-    client = _get_client(region)
-    return client.update_queue_status(InstanceId=instance_id, QueueId=queue_id, Status=status)
+    client = get_connect_client(region)
+    return await run_sync(
+        client.update_queue_status,
+        InstanceId=instance_id,
+        QueueId=queue_id,
+        Status=status,
+    )
 
 
 # Phone Numbers
 async def config_list_phone_numbers(
     instance_id: str,
     max_results: int = 100,
-    region: str | None = None
+    region: str | None = None,
+    next_token: str | None = None
 ) -> dict:
     """List phone numbers for an instance."""
-    client = _get_client(region)
-    # First get instance ARN, then list phone numbers
-    instance_info = client.describe_instance(InstanceId=instance_id)
-    instance_arn = instance_info["Instance"]["Arn"]
-    return client.list_phone_numbers_v2(TargetArn=instance_arn, MaxResults=max_results)
+    client = get_connect_client(region)
+    # Instance ARN in the client's region, built without a describe_instance call
+    instance_arn = await run_sync(get_instance_arn, instance_id, client.meta.region_name)
+    return await run_sync(
+        paginate, client, "list_phone_numbers_v2", max_results, next_token, TargetArn=instance_arn
+    )
 
 
 # Routing Profiles
+_DEFAULT_MEDIA_CONCURRENCIES = [
+    {"Channel": "VOICE", "Concurrency": 1},
+    {"Channel": "CHAT", "Concurrency": 2},
+]
+
+
+@ttl_cache()
 async def config_list_routing_profiles(
     instance_id: str,
     max_results: int = 100,
-    region: str | None = None
+    region: str | None = None,
+    next_token: str | None = None
 ) -> dict:
     """List routing profiles."""
-    client = _get_client(region)
-    return client.list_routing_profiles(InstanceId=instance_id, MaxResults=max_results)
+    client = get_connect_client(region)
+    return await run_sync(
+        paginate, client, "list_routing_profiles", max_results, next_token, InstanceId=instance_id
+    )
 
 
+@invalidates("config_list_routing_profiles")
 async def config_create_routing_profile(
     name: str,
     default_outbound_queue_id: str,
@@ -189,13 +265,11 @@ async def config_create_routing_profile(
     region: str | None = None
 ) -> dict:
     """Create a routing profile."""
-    client = _get_client(region)
+    client = get_connect_client(region)
     effective_instance_id = _get_instance(instance_id)
-    concurrencies = media_concurrencies or [
-        {"Channel": "VOICE", "Concurrency": 1},
-        {"Channel": "CHAT", "Concurrency": 2},
-    ]
-    return client.create_routing_profile(
+    concurrencies = media_concurrencies or _DEFAULT_MEDIA_CONCURRENCIES
+    return await run_sync(
+        client.create_routing_profile,
         InstanceId=effective_instance_id,
         Name=name,
         DefaultOutboundQueueId=default_outbound_queue_id,
@@ -205,16 +279,22 @@ async def config_create_routing_profile(
 
 
 # Hours of Operation
+@ttl_cache()
 async def config_list_hours_of_operations(
     instance_id: str,
     max_results: int = 100,
-    region: str | None = None
+    region: str | None = None,
+    next_token: str | None = None
 ) -> dict:
     """List hours of operation."""
-    client = _get_client(region)
-    return client.list_hours_of_operations(InstanceId=instance_id, MaxResults=max_results)
+    client = get_connect_client(region)
+    return await run_sync(
+        paginate, client, "list_hours_of_operations", max_results, next_token,
+        InstanceId=instance_id,
+    )
 
 
+@invalidates("config_list_hours_of_operations")
 async def config_create_hours_of_operation(
     name: str,
     time_zone: str,
@@ -223,9 +303,10 @@ async def config_create_hours_of_operation(
     region: str | None = None
 ) -> dict:
     """Create hours of operation."""
-    client = _get_client(region)
+    client = get_connect_client(region)
     effective_instance_id = _get_instance(instance_id)
-    return client.create_hours_of_operation(
+    return await run_sync(
+        client.create_hours_of_operation,
         InstanceId=effective_instance_id,
         Name=name,
         TimeZone=time_zone,
@@ -234,36 +315,50 @@ async def config_create_hours_of_operation(
 
 
 # Users
+@ttl_cache()
 async def config_list_users(
     instance_id: str,
     max_results: int = 100,
-    region: str | None = None
+    region: str | None = None,
+    next_token: str | None = None
 ) -> dict:
-    """List users."""
-    client = _get_client(region)
-    return client.list_users(InstanceId=instance_id, MaxResults=max_results)
+    """List users.
+
+    Each summary has the user's Id, Arn and Username; last-modified audit fields
+    are left out. Use config_describe_user for a user's full details.
+    """
+    client = get_connect_client(region)
+    result = await run_sync(
+        paginate, client, "list_users", max_results, next_token, InstanceId=instance_id
+    )
+    return drop_summary_fields(result, "UserSummaryList")
 
 
 async def config_list_security_profiles(
     instance_id: str,
     max_results: int = 100,
-    region: str | None = None
+    region: str | None = None,
+    next_token: str | None = None
 ) -> dict:
     """List security profiles."""
-    client = _get_client(region)
-    return client.list_security_profiles(InstanceId=instance_id, MaxResults=max_results)
+    client = get_connect_client(region)
+    return await run_sync(
+        paginate, client, "list_security_profiles", max_results, next_token, InstanceId=instance_id
+    )
 
 
+@ttl_cache()
 async def config_describe_user(
     instance_id: str,
     user_id: str,
     region: str | None = None
 ) -> dict:
     """Get user details."""
-    client = _get_client(region)
-    return client.describe_user(InstanceId=instance_id, UserId=user_id)
+    client = get_connect_client(region)
+    return await run_sync(client.describe_user, InstanceId=instance_id, UserId=user_id)
 
 
+@invalidates("config_list_users")
 async def config_create_user(
     instance_id: str,
     username: str,
@@ -276,7 +371,7 @@ async def config_create_user(
     region: str | None = None
 ) -> dict:
     """Create a user."""
-    client = _get_client(region)
+    client = get_connect_client(region)
     params = {
         "InstanceId": instance_id,
         "Username": username,
@@ -287,9 +382,49 @@ async def config_create_user(
     }
     if password:
         params["Password"] = password
-    return client.create_user(**params)
+    return await run_sync(client.create_user, **params)
 
 
+async def config_bulk_create_users(
+    instance_id: str,
+    users: list[dict],
+    concurrency: int = 5,
+    region: str | None = None
+) -> dict:
+    """Create many users at once.
+
+    Args:
+        instance_id: Connect instance ID
+        users: One dict per user with config_create_user's arguments
+            (username, routing_profile_id, security_profile_ids, first_name, ...)
+        concurrency: Maximum CreateUser calls in flight at a time
+        region: AWS region
+
+    Returns one result per user, in order, with the new user's Id and Arn or an error.
+    """
+    # Throttled calls are slowed and retried by the clients' adaptive retry mode
+    semaphore = asyncio.Semaphore(max(1, concurrency))
+
+    async def create(user: dict) -> dict:
+        async with semaphore:
+            return await config_create_user(instance_id=instance_id, region=region, **user)
+
+    outcomes = await asyncio.gather(*(create(user) for user in users), return_exceptions=True)
+    results = []
+    for user, outcome in zip(users, outcomes):
+        if isinstance(outcome, Exception):
+            results.append({"username": user.get("username"), "error": str(outcome)})
+        else:
+            results.append({
+                "username": user.get("username"),
+                "UserId": outcome.get("UserId"),
+                "UserArn": outcome.get("UserArn"),
+            })
+    failed = sum("error" in result for result in results)
+    return {"created": len(results) - failed, "failed": failed, "results": results}
+
+
+@invalidates("config_describe_user")
 async def config_update_user_routing_profile(
     instance_id: str,
     user_id: str,
@@ -297,8 +432,9 @@ async def config_update_user_routing_profile(
     region: str | None = None
 ) -> dict:
     """Update user's routing profile."""
-    client = _get_client(region)
-    return client.update_user_routing_profile(
+    client = get_connect_client(region)
+    return await run_sync(
+        client.update_user_routing_profile,
         InstanceId=instance_id,
         UserId=user_id,
         RoutingProfileId=routing_profile_id,
@@ -306,14 +442,18 @@ async def config_update_user_routing_profile(
 
 
 # Agent Status
+@ttl_cache()
 async def config_list_agent_statuses(
     instance_id: str,
     max_results: int = 100,
-    region: str | None = None
+    region: str | None = None,
+    next_token: str | None = None
 ) -> dict:
     """List agent statuses."""
-    client = _get_client(region)
-    return client.list_agent_statuses(InstanceId=instance_id, MaxResults=max_results)
+    client = get_connect_client(region)
+    return await run_sync(
+        paginate, client, "list_agent_statuses", max_results, next_token, InstanceId=instance_id
+    )
 
 
 async def config_put_user_status(
@@ -323,8 +463,9 @@ async def config_put_user_status(
     region: str | None = None
 ) -> dict:
     """Set agent's current status."""
-    client = _get_client(region)
-    return client.put_user_status(
+    client = get_connect_client(region)
+    return await run_sync(
+        client.put_user_status,
         InstanceId=instance_id,
         UserId=user_id,
         AgentStatusId=agent_status_id,
@@ -1,10 +1,16 @@
 """Tier 2: Contact tools - Defer loaded."""
-from ..aws_clients import get_connect_client
-from .config import _session_context
+from ..aws_clients import get_connect_client, run_sync
 
-
-def _get_session_region():
-    return _session_context.get("region")
+__all__ = [
+    "contacts_start_outbound_voice",
+    "contacts_start_chat",
+    "contacts_start_task",
+    "contacts_stop",
+    "contacts_transfer",
+    "contacts_update_attributes",
+    "contacts_start_recording",
+    "contacts_stop_recording",
+]
 
 
 # Outbound Contacts
@@ -16,7 +22,7 @@ async def contacts_start_outbound_voice(
     attributes: dict[str, str] | None = None
 ) -> dict:
     """Initiate an outbound voice call."""
-    client = get_connect_client(_get_session_region())
+    client = get_connect_client()
     params = {
         "InstanceId": instance_id,
         "DestinationPhoneNumber": destination_phone,
@@ -25,7 +31,7 @@ async def contacts_start_outbound_voice(
     }
     if attributes:
         params["Attributes"] = attributes
-    return client.start_outbound_voice_contact(**params)
+    return await run_sync(client.start_outbound_voice_contact, **params)
 
 
 async def contacts_start_chat(
@@ -35,7 +41,7 @@ async def contacts_start_chat(
     attributes: dict[str, str] | None = None
 ) -> dict:
     """Start a chat contact."""
-    client = get_connect_client(_get_session_region())
+    client = get_connect_client()
     params = {
         "InstanceId": instance_id,
         "ContactFlowId": contact_flow_id,
@@ -43,7 +49,7 @@ async def contacts_start_chat(
     }
     if attributes:
         params["Attributes"] = attributes
-    return client.start_chat_contact(**params)
+    return await run_sync(client.start_chat_contact, **params)
 
 
 async def contacts_start_task(
@@ -54,7 +60,7 @@ async def contacts_start_task(
     attributes: dict[str, str] | None = None
 ) -> dict:
     """Create a task contact."""
-    client = get_connect_client(_get_session_region())
+    client = get_connect_client()
     params = {
         "InstanceId": instance_id,
         "ContactFlowId": contact_flow_id,
@@ -63,14 +69,14 @@ async def contacts_start_task(
     }
     if attributes:
         params["Attributes"] = attributes
-    return client.start_task_contact(**params)
+    return await run_sync(client.start_task_contact, **params)
 
 
 # Contact Management
 async def contacts_stop(instance_id: str, contact_id: str) -> dict:
     """End a contact."""
-    client = get_connect_client(_get_session_region())
-    return client.stop_contact(InstanceId=instance_id, ContactId=contact_id)
+    client = get_connect_client()
+    return await run_sync(client.stop_contact, InstanceId=instance_id, ContactId=contact_id)
 
 
 async def contacts_transfer(
@@ -80,13 +86,13 @@ async def contacts_transfer(
     user_id: str | None = None
 ) -> dict:
     """Transfer a contact to a queue or user."""
-    client = get_connect_client(_get_session_region())
+    client = get_connect_client()
     params = {"InstanceId": instance_id, "ContactId": contact_id}
     if queue_id:
         params["QueueId"] = queue_id
     if user_id:
         params["UserId"] = user_id
-    return client.transfer_contact(**params)
+    return await run_sync(client.transfer_contact, **params)
 
 
 async def contacts_update_attributes(
@@ -95,8 +101,9 @@ async def contacts_update_attributes(
     attributes: dict[str, str]
 ) -> dict:
     """Update contact attributes."""
-    client = get_connect_client(_get_session_region())
-    return client.update_contact_attributes(
+    client = get_connect_client()
+    return await run_sync(
+        client.update_contact_attributes,
         InstanceId=instance_id,
         InitialContactId=contact_id,
         Attributes=attributes,
@@ -110,8 +117,9 @@ async def contacts_start_recording(
     voice_recording: bool = True
 ) -> dict:
     """Start contact recording."""
-    client = get_connect_client(_get_session_region())
-    return client.start_contact_recording(
+    client = get_connect_client()
+    return await run_sync(
+        client.start_contact_recording,
         InstanceId=instance_id,
         ContactId=contact_id,
         InitialContactId=contact_id,
@@ -121,8 +129,9 @@ async def contacts_start_recording(
 
 async def contacts_stop_recording(instance_id: str, contact_id: str) -> dict:
     """Stop contact recording."""
-    client = get_connect_client(_get_session_region())
-    return client.stop_contact_recording(
+    client = get_connect_client()
+    return await run_sync(
+        client.stop_contact_recording,
         InstanceId=instance_id,
         ContactId=contact_id,
         InitialContactId=contact_id,
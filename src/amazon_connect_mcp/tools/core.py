@@ -1,27 +1,45 @@
 """Tier 1: Core tools - Always loaded."""
-from fastmcp import Context
-from ..aws_clients import get_connect_client, get_cases_client, get_instance_region
+import asyncio
 
-# Import session context from config module
-from .config import _session_context
+from ..aws_clients import (
+    CONNECT_REGIONS,
+    clear_instance_region_cache,
+    drop_summary_fields,
+    get_cases_client,
+    get_connect_client,
+    get_instance_region,
+    get_queue_ids,
+    paginate,
+    reachable_regions,
+    run_sync,
+    scan_region,
+)
+from ..cache import invalidates, ttl_cache
+from ..session import current_session
 
-
-def _get_session_region():
-    """Get region from session context."""
-    return _session_context.get("region")
-
-
-def _get_session_instance():
-    """Get instance_id from session context."""
-    return _session_context.get("instance_id")
+__all__ = [
+    "describe_instance",
+    "create_instance",
+    "delete_instance",
+    "list_instances",
+    "list_queues",
+    "get_current_metrics",
+    "search_contacts",
+    "describe_contact",
+    "create_case",
+    "get_case",
+    "search_cases",
+    "list_domains_for_instance",
+]
 
 
 # Instance & Configuration
+@ttl_cache()
 async def describe_instance(instance_id: str) -> dict:
     """Get Amazon Connect instance details."""
-    region = get_instance_region(instance_id)
+    region = await run_sync(get_instance_region, instance_id)
     client = get_connect_client(region)
-    result = client.describe_instance(InstanceId=instance_id)
+    result = await run_sync(client.describe_instance, InstanceId=instance_id)
     # Add region info to the result
     result['Instance']['Region'] = region
     return result
@@ -44,7 +62,8 @@ async def create_instance(
         region: AWS region for the instance
     """
     client = get_connect_client(region)
-    return client.create_instance(
+    return await run_sync(
+        client.create_instance,
         InstanceAlias=instance_alias,
         IdentityManagementType=identity_management_type,
         InboundCallsEnabled=inbound_calls_enabled,
@@ -52,6 +71,7 @@ async def create_instance(
     )
 
 
+@invalidates("describe_instance")
 async def delete_instance(
     instance_id: str,
     confirm: bool = False
@@ -74,9 +94,10 @@ async def delete_instance(
             "instance_id": instance_id
         }
     
-    region = get_instance_region(instance_id)
+    region = await run_sync(get_instance_region, instance_id)
     client = get_connect_client(region)
-    client.delete_instance(InstanceId=instance_id)
+    await run_sync(client.delete_instance, InstanceId=instance_id)
+    clear_instance_region_cache(instance_id)
     return {
         "status": "DELETED",
         "message": f"Instance {instance_id} has been permanently deleted",
@@ -84,31 +105,33 @@ async def delete_instance(
     }
 
 
+def _list_region_instances(client) -> list[dict]:
+    """List the instances in the client's region, tagged with that region."""
+    result = paginate(client, "list_instances")
+    instances = result.get('InstanceSummaryList', [])
+    for inst in instances:
+        inst['Region'] = client.meta.region_name
+    return instances
+
+
 async def list_instances(region: str | None = None) -> dict:
     """List all Amazon Connect instances. If no region specified, lists across all regions."""
+    unreachable = None
     if region:
-        client = get_connect_client(region)
-        result = client.list_instances()
-        for inst in result.get('InstanceSummaryList', []):
-            inst['Region'] = region
-        instances = result.get('InstanceSummaryList', [])
+        instances = await run_sync(_list_region_instances, get_connect_client(region))
     else:
-        # List across all Connect-supported regions
-        regions = ['us-east-1', 'us-west-2', 'eu-west-2', 'eu-central-1', 'ap-southeast-1', 
-                   'ap-southeast-2', 'ap-northeast-1', 'ap-northeast-2', 'ca-central-1', 'af-south-1']
-        
-        instances = []
-        for r in regions:
-            try:
-                client = get_connect_client(r)
-                result = client.list_instances()
-                for inst in result.get('InstanceSummaryList', []):
-                    inst['Region'] = r
-                    instances.append(inst)
-            except Exception:
-                pass
+        # Query every reachable Connect region at once; regions that fail are skipped
+        regions = reachable_regions(CONNECT_REGIONS)
+        results = await asyncio.gather(
+            *(run_sync(scan_region, r, _list_region_instances) for r in regions),
+            return_exceptions=True,
+        )
+        instances = [inst for result in results if isinstance(result, list) for inst in result]
+        failed = {r for r, result in zip(regions, results) if not isinstance(result, list)}
+        # Regions recently down are skipped, so report them with the ones that failed now
+        unreachable = [r for r in CONNECT_REGIONS if r not in regions or r in failed]
     
-    return {
+    response = {
         'InstanceSummaryList': instances,
         '_llm_guidance': {
             'nextStep': 'Ask user which instance to work with, then call set_session',
@@ -122,43 +145,90 @@ async def list_instances(region: str | None = None) -> dict:
             'note': 'Setting session ensures all subsequent operations use correct region'
         }
     }
+    if unreachable is not None:
+        # Instances in these regions are missing from the list; retry them shortly
+        response['unreachable_regions'] = unreachable
+    return response
+
 
+async def list_queues(
+    instance_id: str, max_results: int = 100, next_token: str | None = None
+) -> dict:
+    """List queues in an Amazon Connect instance.
 
-async def list_queues(instance_id: str, max_results: int = 100) -> dict:
-    """List queues in an Amazon Connect instance."""
-    region = _get_session_region() or get_instance_region(instance_id)
+    Each summary has the queue's Id, Arn, Name and QueueType; last-modified audit
+    fields are left out. Use config_describe_queue for a queue's full details.
+    """
+    region = current_session().region or await run_sync(get_instance_region, instance_id)
     client = get_connect_client(region)
-    return client.list_queues(InstanceId=instance_id, MaxResults=max_results)
+    result = await run_sync(
+        paginate, client, "list_queues", max_results, next_token, InstanceId=instance_id
+    )
+    return drop_summary_fields(result, "QueueSummaryList")
 
 
 # Real-time Metrics
+# GetCurrentMetricData takes at most 100 queues per filter
+_MAX_METRIC_QUEUES = 100
+
+
+def _get_current_queue_metrics(client, queue_ids: list[str], **params) -> dict:
+    """Every page of get_current_metric_data results for one group of queues."""
+    params["Filters"] = {**params["Filters"], "Queues": queue_ids}
+    response = client.get_current_metric_data(**params)
+    results = response.get("MetricResults", [])
+    while response.get("NextToken"):
+        response = client.get_current_metric_data(**params, NextToken=response["NextToken"])
+        results += response.get("MetricResults", [])
+    response["MetricResults"] = results
+    return response
+
+
 async def get_current_metrics(
     instance_id: str,
     queue_ids: list[str] | None = None,
     channel: str = "VOICE"
 ) -> dict:
-    """Get real-time metrics for queues and agents. If no queue_ids provided, fetches all queues first."""
-    region = _get_session_region() or get_instance_region(instance_id)
+    """Get real-time metrics for queues and agents. If no queue_ids provided, fetches all queues first.
+
+    Up to 100 queues are reported together. More are queried in groups of 100
+    and reported per queue, as one combined figure can cover at most 100 queues.
+    """
+    region = current_session().region or await run_sync(get_instance_region, instance_id)
     client = get_connect_client(region)
     
     # If no queues specified, get all queues
     if not queue_ids:
-        queues_resp = client.list_queues(InstanceId=instance_id, MaxResults=100)
-        queue_ids = [q['Id'] for q in queues_resp.get('QueueSummaryList', [])]
+        queue_ids = await run_sync(get_queue_ids, instance_id, region)
     
     if not queue_ids:
         return {"MetricResults": [], "message": "No queues found"}
     
-    return client.get_current_metric_data(
-        InstanceId=instance_id,
-        Filters={"Queues": queue_ids, "Channels": [channel]},
-        CurrentMetrics=[
+    params = {
+        "InstanceId": instance_id,
+        "Filters": {"Channels": [channel]},
+        "CurrentMetrics": [
             {"Name": "AGENTS_AVAILABLE", "Unit": "COUNT"},
             {"Name": "AGENTS_ONLINE", "Unit": "COUNT"},
             {"Name": "CONTACTS_IN_QUEUE", "Unit": "COUNT"},
             {"Name": "OLDEST_CONTACT_AGE", "Unit": "SECONDS"},
         ],
-    )
+    }
+    if len(queue_ids) <= _MAX_METRIC_QUEUES:
+        return await run_sync(_get_current_queue_metrics, client, queue_ids, **params)
+    
+    groups = [
+        queue_ids[start:start + _MAX_METRIC_QUEUES]
+        for start in range(0, len(queue_ids), _MAX_METRIC_QUEUES)
+    ]
+    responses = await asyncio.gather(*(
+        run_sync(_get_current_queue_metrics, client, group, Groupings=["QUEUE"], **params)
+        for group in groups
+    ))
+    return {
+        "MetricResults": [result for response in responses for result in response["MetricResults"]],
+        "DataSnapshotTime": responses[0].get("DataSnapshotTime"),
+    }
 
 
 # Contact Operations
@@ -169,9 +239,10 @@ async def search_contacts(
     max_results: int = 100
 ) -> dict:
     """Search contacts within a time range (ISO 8601 format)."""
-    region = _get_session_region() or get_instance_region(instance_id)
+    region = current_session().region or await run_sync(get_instance_region, instance_id)
     client = get_connect_client(region)
-    return client.search_contacts(
+    return await run_sync(
+        client.search_contacts,
         InstanceId=instance_id,
         TimeRange={
             "Type": "INITIATION_TIMESTAMP",
@@ -184,9 +255,9 @@ async def search_contacts(
 
 async def describe_contact(instance_id: str, contact_id: str) -> dict:
     """Get details of a specific contact."""
-    region = _get_session_region() or get_instance_region(instance_id)
+    region = current_session().region or await run_sync(get_instance_region, instance_id)
     client = get_connect_client(region)
-    return client.describe_contact(InstanceId=instance_id, ContactId=contact_id)
+    return await run_sync(client.describe_contact, InstanceId=instance_id, ContactId=contact_id)
 
 
 # Cases - Core Operations
@@ -197,9 +268,9 @@ async def create_case(
     region: str | None = None
 ) -> dict:
     """Create a new case."""
-    effective_region = region or _get_session_region()
-    client = get_cases_client(effective_region)
-    return client.create_case(
+    client = get_cases_client(region)
+    return await run_sync(
+        client.create_case,
         domainId=domain_id,
         templateId=template_id,
         fields=[{"id": k, "value": {"stringValue": v}} for k, v in fields.items()],
@@ -208,9 +279,13 @@ async def create_case(
 
 async def get_case(domain_id: str, case_id: str, region: str | None = None) -> dict:
     """Get case details."""
-    effective_region = region or _get_session_region()
-    client = get_cases_client(effective_region)
-    return client.get_case(domainId=domain_id, caseId=case_id, fields=[{"id": "title"}])
+    client = get_cases_client(region)
+    return await run_sync(
+        client.get_case,
+        domainId=domain_id,
+        caseId=case_id,
+        fields=[{"id": "title"}],
+    )
 
 
 async def search_cases(
@@ -221,18 +296,17 @@ async def search_cases(
     region: str | None = None
 ) -> dict:
     """Search cases in a domain."""
-    effective_region = region or _get_session_region()
-    client = get_cases_client(effective_region)
+    client = get_cases_client(region)
     params = {"domainId": domain_id, "maxResults": max_results}
     if filter_field and filter_value:
         params["filter"] = {
             "field": {"id": filter_field, "value": {"stringValue": filter_value}}
         }
-    return client.search_cases(**params)
+    return await run_sync(client.search_cases, **params)
 
 
 async def list_domains_for_instance(instance_id: str, max_results: int = 10) -> dict:
     """List case domains for a specific Connect instance."""
-    region = _get_session_region() or get_instance_region(instance_id)
+    region = current_session().region or await run_sync(get_instance_region, instance_id)
     client = get_cases_client(region)
-    return client.list_domains(maxResults=min(max_results, 10))
+    return await run_sync(client.list_domains, maxResults=min(max_results, 10))
@@ -1,14 +1,46 @@
 """Tier 2: Customer Profiles tools - Defer loaded."""
-from ..aws_clients import get_profiles_client, get_connect_client
-from .config import _session_context
+import asyncio
+import functools
+import re
+import weakref
 
+from ..aws_clients import get_instance_arn, get_profiles_client, run_sync
+from ..cache import invalidates, ttl_cache
+from ..session import current_session
 
-def _get_session_region():
-    return _session_context.get("region")
+__all__ = [
+    "profiles_create_profile",
+    "profiles_search",
+    "profiles_get_profile",
+    "profiles_update_profile",
+    "profiles_delete_profile",
+    "profiles_merge",
+    "profiles_list_domains",
+    "profiles_create_domain",
+    "profiles_associate_domain",
+]
 
 
-def _get_session_instance():
-    return _session_context.get("instance_id")
+def _profile_fields(
+    first_name: str | None,
+    last_name: str | None,
+    email: str | None,
+    phone: str | None,
+    attributes: dict[str, str] | None,
+) -> dict:
+    """API fields for the profile details that were given."""
+    fields = {}
+    if first_name:
+        fields["FirstName"] = first_name
+    if last_name:
+        fields["LastName"] = last_name
+    if email:
+        fields["EmailAddress"] = email
+    if phone:
+        fields["PhoneNumber"] = phone
+    if attributes:
+        fields["Attributes"] = attributes
+    return fields
 
 
 async def profiles_create_profile(
@@ -20,46 +52,147 @@ async def profiles_create_profile(
     attributes: dict[str, str] | None = None
 ) -> dict:
     """Create a customer profile."""
-    client = get_profiles_client(_get_session_region())
-    params = {"DomainName": domain_name}
-    if first_name:
-        params["FirstName"] = first_name
-    if last_name:
-        params["LastName"] = last_name
-    if email:
-        params["EmailAddress"] = email
-    if phone:
-        params["PhoneNumber"] = phone
-    if attributes:
-        params["Attributes"] = attributes
-    return client.create_profile(**params)
+    client = get_profiles_client()
+    return await run_sync(
+        client.create_profile,
+        DomainName=domain_name,
+        **_profile_fields(first_name, last_name, email, phone, attributes),
+    )
 
 
 async def profiles_search(
     domain_name: str,
     key_name: str,
     values: list[str],
-    max_results: int = 25
+    max_results: int = 25,
+    next_token: str | None = None
 ) -> dict:
-    """Search profiles by key (e.g., _email, _phone, _account)."""
-    client = get_profiles_client(_get_session_region())
-    return client.search_profiles(
-        DomainName=domain_name,
-        KeyName=key_name,
-        Values=values,
-        MaxResults=max_results,
-    )
+    """Search profiles by key (e.g., _email, _phone, _account).
+
+    Pass a response's NextToken back as next_token to get the next page.
+    """
+    # The API model sets no minimum on Values, so botocore would send an empty search
+    if not values:
+        return {"error": "values is empty", "action": "Provide at least one value to search for"}
+    client = get_profiles_client()
+    params = {
+        "DomainName": domain_name,
+        "KeyName": key_name,
+        "Values": values,
+        "MaxResults": max_results,
+    }
+    if next_token:
+        params["NextToken"] = next_token
+    return await run_sync(client.search_profiles, **params)
+
+
+# BatchGetProfile accepts at most 20 profile IDs per call
+_BATCH_GET_PROFILE_MAX = 20
+
+# Profile lookups waiting for the next batch_get_profile, kept per event loop so a
+# closed loop's lookups never hold up another's: loop -> domain -> profile ID -> waiters
+_pending_profiles: weakref.WeakKeyDictionary[
+    asyncio.AbstractEventLoop, dict[str, dict[str, list[asyncio.Future]]]
+] = weakref.WeakKeyDictionary()
+# Flushes in progress; the loop keeps only weak references to its tasks
+_flush_tasks: set[asyncio.Task] = set()
+
+
+async def _fetch_profiles(
+    domain_name: str, batch: list[str], waiters: dict[str, list[asyncio.Future]]
+) -> None:
+    # Any failure, including an unexpected response, goes to this batch's waiters
+    # rather than out of the flush, where it would cut short the other batches
+    try:
+        client = get_profiles_client()
+        response = await run_sync(
+            client.batch_get_profile, DomainName=domain_name, ProfileIds=batch
+        )
+        outcomes = {p["ProfileId"]: p for p in response.get("Profiles", [])}
+    except Exception as exc:
+        outcomes = dict.fromkeys(batch, exc)
+    for profile_id in batch:
+        outcome = outcomes.get(profile_id)
+        for future in waiters[profile_id]:
+            if future.done():
+                continue
+            if isinstance(outcome, Exception):
+                future.set_exception(outcome)
+            else:
+                future.set_result(outcome)
+
+
+async def _flush_profile_lookups(
+    loop: asyncio.AbstractEventLoop, pending: dict[str, dict[str, list[asyncio.Future]]]
+) -> None:
+    """Send the queued lookups, one batch_get_profile per 20 IDs."""
+    # Close the queue first, so lookups from here on schedule the next flush
+    if _pending_profiles.get(loop) is pending:
+        del _pending_profiles[loop]
+    fetches = []
+    for domain_name, waiters in pending.items():
+        profile_ids = list(waiters)
+        for start in range(0, len(profile_ids), _BATCH_GET_PROFILE_MAX):
+            batch = profile_ids[start:start + _BATCH_GET_PROFILE_MAX]
+            fetches.append(_fetch_profiles(domain_name, batch, waiters))
+    await asyncio.gather(*fetches)
+
+
+def _flush_done(
+    loop: asyncio.AbstractEventLoop,
+    pending: dict[str, dict[str, list[asyncio.Future]]],
+    task: asyncio.Task,
+) -> None:
+    """Release the lookups a finished flush left unanswered, e.g. because it was cancelled."""
+    _flush_tasks.discard(task)
+    # A flush cancelled before it started never closed its queue
+    if _pending_profiles.get(loop) is pending:
+        del _pending_profiles[loop]
+    for waiters in pending.values():
+        for futures in waiters.values():
+            for future in futures:
+                if not future.done():
+                    future.cancel()
+
+
+async def _get_profile(domain_name: str, profile_id: str) -> dict | None:
+    """Look up one profile through the next batched batch_get_profile call."""
+    # Lookups issued together (e.g. gathered tool calls) share one batch_get_profile;
+    # the flush runs on the loop's next pass, so a lone lookup is not delayed
+    loop = asyncio.get_running_loop()
+    future = loop.create_future()
+    pending = _pending_profiles.get(loop)
+    if pending is None:
+        pending = _pending_profiles[loop] = {}
+        task = loop.create_task(_flush_profile_lookups(loop, pending))
+        _flush_tasks.add(task)
+        task.add_done_callback(functools.partial(_flush_done, loop, pending))
+    pending.setdefault(domain_name, {}).setdefault(profile_id, []).append(future)
+    return await future
+
+
+@ttl_cache()
+async def _cached_profile(domain_name: str, profile_id: str) -> dict:
+    """Profile lookup behind profiles_get_profile.
+
+    A miss raises LookupError so it is not cached: a profile created moments ago
+    may not be readable yet, and should be found as soon as it is.
+    """
+    profile = await _get_profile(domain_name, profile_id)
+    if not profile:
+        raise LookupError(profile_id)
+    return profile
 
 
 async def profiles_get_profile(domain_name: str, profile_id: str) -> dict:
     """Get profile details."""
-    client = get_profiles_client(_get_session_region())
-    response = client.batch_get_profile(DomainName=domain_name, ProfileIds=[profile_id])
-    if response.get("Profiles"):
-        return response["Profiles"][0]
-    return {"error": "Profile not found", "ProfileId": profile_id}
+    try:
+        return await _cached_profile(domain_name, profile_id)
+    except LookupError:
+        return {"error": "Profile not found", "ProfileId": profile_id}
 
 
+@invalidates("_cached_profile")
 async def profiles_update_profile(
     domain_name: str,
     profile_id: str,
@@ -70,71 +203,122 @@ async def profiles_update_profile(
     attributes: dict[str, str] | None = None
 ) -> dict:
     """Update a customer profile."""
-    client = get_profiles_client(_get_session_region())
-    params = {"DomainName": domain_name, "ProfileId": profile_id}
-    if first_name:
-        params["FirstName"] = first_name
-    if last_name:
-        params["LastName"] = last_name
-    if email:
-        params["EmailAddress"] = email
-    if phone:
-        params["PhoneNumber"] = phone
-    if attributes:
-        params["Attributes"] = attributes
-    return client.update_profile(**params)
+    client = get_profiles_client()
+    return await run_sync(
+        client.update_profile,
+        DomainName=domain_name,
+        ProfileId=profile_id,
+        **_profile_fields(first_name, last_name, email, phone, attributes),
+    )
 
 
+@invalidates("_cached_profile")
 async def profiles_delete_profile(domain_name: str, profile_id: str) -> dict:
     """Delete a customer profile."""
-    client = get_profiles_client(_get_session_region())
-    return client.delete_profile(DomainName=domain_name, ProfileId=profile_id)
+    client = get_profiles_client()
+    return await run_sync(client.delete_profile, DomainName=domain_name, ProfileId=profile_id)
+
 
+# MergeProfiles accepts at most 20 profiles to merge per call
+_MERGE_PROFILES_MAX = 20
 
+
+@invalidates("_cached_profile")
 async def profiles_merge(
     domain_name: str,
     main_profile_id: str,
     profile_ids_to_merge: list[str]
 ) -> dict:
     """Merge duplicate profiles."""
-    client = get_profiles_client(_get_session_region())
-    return client.merge_profiles(
+    # botocore checks the lower bound but not the upper one, so catch that here
+    if len(profile_ids_to_merge) > _MERGE_PROFILES_MAX:
+        return {
+            "error": f"At most {_MERGE_PROFILES_MAX} profiles can be merged per call",
+            "action": "Split profile_ids_to_merge into smaller groups and merge each group"
+        }
+    # A merge cannot be undone, so confirm every profile exists first; the lookups
+    # are batched together into at most two batch_get_profile calls
+    profile_ids = [main_profile_id, *profile_ids_to_merge]
+    profiles = await asyncio.gather(*(_get_profile(domain_name, pid) for pid in profile_ids))
+    missing = [pid for pid, profile in zip(profile_ids, profiles) if not profile]
+    if missing:
+        return {
+            "error": "Profiles not found",
+            "missing": missing,
+            "action": "Check the profile IDs with profiles_search before merging"
+        }
+    client = get_profiles_client()
+    return await run_sync(
+        client.merge_profiles,
         DomainName=domain_name,
         MainProfileId=main_profile_id,
         ProfileIdsToBeMerged=profile_ids_to_merge,
     )
 
 
+@ttl_cache()
 async def profiles_list_domains(max_results: int = 25) -> dict:
     """List profile domains."""
-    client = get_profiles_client(_get_session_region())
-    return client.list_domains(MaxResults=max_results)
+    client = get_profiles_client()
+    return await run_sync(client.list_domains, MaxResults=max_results)
+
+
+_CREATE_DOMAIN_GUIDANCE = {
+    "nextSteps": [
+        "1. Associate this domain with your Connect instance using profiles_associate_domain",
+        "2. Then associate Cases domain using cases_associate_domain (requires profiles first)"
+    ],
+    "CRITICAL": "Cases integration requires Customer Profiles to be associated FIRST"
+}
+_CASES_ASSOCIATION_STEP = {"tool": "cases_associate_domain", "note": "Do this AFTER profiles association"}
 
 
+@invalidates("profiles_list_domains")
 async def profiles_create_domain(
     domain_name: str,
     default_expiration_days: int = 365
 ) -> dict:
     """Create a profile domain."""
-    client = get_profiles_client(_get_session_region())
-    result = client.create_domain(
+    client = get_profiles_client()
+    result = await run_sync(
+        client.create_domain,
         DomainName=domain_name,
         DefaultExpirationDays=default_expiration_days,
     )
     result["_llm_guidance"] = {
-        "nextSteps": [
-            "1. Associate this domain with your Connect instance using profiles_associate_domain",
-            "2. Then associate Cases domain using cases_associate_domain (requires profiles first)"
-        ],
+        **_CREATE_DOMAIN_GUIDANCE,
         "workflow": {
             "step1": {"tool": "profiles_associate_domain", "params": {"domain_name": domain_name}},
-            "step2": {"tool": "cases_associate_domain", "note": "Do this AFTER profiles association"}
+            "step2": _CASES_ASSOCIATION_STEP,
         },
-        "CRITICAL": "Cases integration requires Customer Profiles to be associated FIRST"
     }
     return result
 
 
+_ASSOCIATED_GUIDANCE = {
+    "status": "Customer Profiles domain associated successfully",
+    "nextStep": {
+        "description": "Now you can associate a Cases domain",
+        "tool": "cases_associate_domain",
+        "note": "Cases requires Customer Profiles to be associated first"
+    },
+}
+
+
+_NO_INSTANCE_ERROR = {
+    "error": "No instance_id provided and no session set",
+    "action": "Call set_session(instance_id, region) first or provide instance_id parameter"
+}
+_NO_REGION_ERROR = {
+    "error": "No region set in session",
+    "action": "Call set_session(instance_id, region) first"
+}
+
+# Connect instance IDs are UUIDs; object type names follow the PutIntegration model
+_INSTANCE_ID_RE = re.compile(r"[0-9a-f]{8}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{4}-[0-9a-f]{12}")
+_OBJECT_TYPE_NAME_RE = re.compile(r"[a-zA-Z_][a-zA-Z_0-9-]{0,254}")
+
+
 async def profiles_associate_domain(
     domain_name: str,
     instance_id: str | None = None,
@@ -160,41 +344,44 @@ async def profiles_associate_domain(
     3. Create cases domain (cases_create_domain)  
     4. Associate cases domain (cases_associate_domain)
     """
-    region = _get_session_region()
-    effective_instance_id = instance_id or _get_session_instance()
+    session = current_session()
+    region = session.region
+    effective_instance_id = instance_id or session.instance_id
     
     if not effective_instance_id:
+        return _NO_INSTANCE_ERROR
+    
+    if not region:
+        return _NO_REGION_ERROR
+    
+    # Connect IDs are lowercase; accept a pasted uppercase one and use its canonical form
+    effective_instance_id = effective_instance_id.lower()
+    if not _INSTANCE_ID_RE.fullmatch(effective_instance_id):
         return {
-            "error": "No instance_id provided and no session set",
-            "action": "Call set_session(instance_id, region) first or provide instance_id parameter"
+            "error": f"Malformed instance_id: {effective_instance_id}",
+            "action": "Use the instance ID (a UUID), not its alias or ARN"
         }
     
-    if not region:
+    if not _OBJECT_TYPE_NAME_RE.fullmatch(object_type_name):
         return {
-            "error": "No region set in session",
-            "action": "Call set_session(instance_id, region) first"
+            "error": f"Invalid object_type_name: {object_type_name}",
+            "action": "Use CTR or an object type name defined in the domain"
         }
     
-    # Get the instance ARN
-    connect_client = get_connect_client(region)
-    instance_info = connect_client.describe_instance(InstanceId=effective_instance_id)
-    instance_arn = instance_info["Instance"]["Arn"]
+    # Instance ARN, built without a describe_instance call
+    instance_arn = await run_sync(get_instance_arn, effective_instance_id, region)
     
     # Create the integration
     profiles_client = get_profiles_client(region)
-    result = profiles_client.put_integration(
+    result = await run_sync(
+        profiles_client.put_integration,
         DomainName=domain_name,
         Uri=instance_arn,
         ObjectTypeName=object_type_name
     )
     
     result["_llm_guidance"] = {
-        "status": "Customer Profiles domain associated successfully",
-        "nextStep": {
-            "description": "Now you can associate a Cases domain",
-            "tool": "cases_associate_domain",
-            "note": "Cases requires Customer Profiles to be associated first"
-        },
+        **_ASSOCIATED_GUIDANCE,
         "whatThisDoes": f"Contact data (CTR) from instance will now flow into {domain_name} profiles"
     }
     
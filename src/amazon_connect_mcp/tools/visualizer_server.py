@@ -1,27 +1,78 @@
 """Standalone web server for the Layout Visualizer."""
 
+import gzip
 import http.server
-import socketserver
 import webbrowser
+from functools import lru_cache
+
 from .visualizer import get_visualizer_html
 
 PORT = 8765
 
 
+@lru_cache(maxsize=1)
+def _page() -> bytes:
+    """The encoded page, built once and served as-is after that."""
+    return get_visualizer_html().encode()
+
+
+@lru_cache(maxsize=1)
+def _page_gzip() -> bytes:
+    """The page compressed once, for clients that accept gzip."""
+    return gzip.compress(_page(), compresslevel=9)
+
+
+def _accepts_gzip(accept_encoding: str) -> bool:
+    """Whether an Accept-Encoding header allows gzip, honouring q-values.
+
+    gzip (or its x-gzip alias) counts when listed with q > 0; otherwise a
+    wildcard decides. A refused coding such as "gzip;q=0" is never sent.
+    """
+    qvalues = {}
+    for entry in accept_encoding.split(","):
+        coding, _, params = entry.partition(";")
+        coding = coding.strip().lower()
+        if not coding:
+            continue
+        q = 1.0
+        for param in params.split(";"):
+            name, _, value = param.partition("=")
+            if name.strip().lower() == "q":
+                try:
+                    q = float(value)
+                except ValueError:
+                    q = 0.0
+        qvalues[coding] = q
+    for coding in ("gzip", "x-gzip", "*"):
+        if coding in qvalues:
+            return qvalues[coding] > 0
+    return False
+
+
 class VisualizerHandler(http.server.SimpleHTTPRequestHandler):
     def do_GET(self):
         if self.path == "/" or self.path == "/index.html":
+            use_gzip = _accepts_gzip(self.headers.get("Accept-Encoding", ""))
+            body = _page_gzip() if use_gzip else _page()
             self.send_response(200)
             self.send_header("Content-type", "text/html")
+            if use_gzip:
+                self.send_header("Content-Encoding", "gzip")
+            self.send_header("Vary", "Accept-Encoding")
+            self.send_header("Content-Length", str(len(body)))
             self.end_headers()
-            self.wfile.write(get_visualizer_html().encode())
+            self.wfile.write(body)
         else:
             self.send_error(404)
 
 
 def run_visualizer(open_browser: bool = True):
     """Run the layout visualizer web server."""
-    with socketserver.TCPServer(("", PORT), VisualizerHandler) as httpd:
+    # Render before listening so the first request is served from the cache too
+    _page_gzip()
+    # One thread per connection, so a slow client does not hold up the others;
+    # ThreadingHTTPServer also sets SO_REUSEADDR for quick restarts
+    with http.server.ThreadingHTTPServer(("", PORT), VisualizerHandler) as httpd:
         url = f"http://localhost:{PORT}"
         print(f"🎨 Layout Visualizer running at {url}")
         if open_browser:
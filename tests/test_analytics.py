@@ -0,0 +1,57 @@
+import asyncio
+from types import SimpleNamespace
+
+from amazon_connect_mcp.tools import analytics
+
+
+class FakeConnectClient:
+    """Records get_metric_data_v2 calls and answers one result per queue, two per page."""
+
+    def __init__(self):
+        self.meta = SimpleNamespace(region_name="us-east-1")
+        self.calls = []
+
+    def get_metric_data_v2(self, **params):
+        self.calls.append(params)
+        (queue_filter,) = params["Filters"]
+        queue_ids = queue_filter["FilterValues"]
+        assert 1 <= len(queue_ids) <= 100
+        start = int(params.get("NextToken", 0))
+        page = queue_ids[start:start + 2]
+        response = {"MetricResults": [{"Dimensions": {"QUEUE": q}} for q in page]}
+        if start + 2 < len(queue_ids):
+            response["NextToken"] = str(start + 2)
+        return response
+
+
+def _get_metric_data(monkeypatch, queue_ids):
+    client = FakeConnectClient()
+    monkeypatch.setattr(analytics, "get_connect_client", lambda: client)
+    monkeypatch.setattr(analytics, "get_standard_queue_ids", lambda instance_id, region: queue_ids)
+    monkeypatch.setattr(
+        analytics, "get_instance_arn",
+        lambda instance_id, region: f"arn:aws:connect:{region}:123456789012:instance/{instance_id}",
+    )
+    result = asyncio.run(
+        analytics.analytics_get_metric_data("instance-1", "2024-01-01T00:00:00Z", "2024-01-02T00:00:00Z")
+    )
+    return client, result
+
+
+def test_get_metric_data_splits_more_than_100_queues(monkeypatch):
+    queue_ids = [f"queue-{n}" for n in range(250)]
+    client, result = _get_metric_data(monkeypatch, queue_ids)
+
+    queried = {tuple(call["Filters"][0]["FilterValues"]) for call in client.calls}
+    assert sorted(map(len, queried)) == [50, 100, 100]
+    assert all(call["Groupings"] == ["QUEUE"] for call in client.calls)
+    assert [r["Dimensions"]["QUEUE"] for r in result["MetricResults"]] == queue_ids
+    assert "NextToken" not in result
+
+
+def test_get_metric_data_keeps_up_to_100_queues_together(monkeypatch):
+    client, result = _get_metric_data(monkeypatch, [f"queue-{n}" for n in range(100)])
+
+    assert len(client.calls) == 50
+    assert all("Groupings" not in call for call in client.calls)
+    assert len(result["MetricResults"]) == 100
@@ -0,0 +1,131 @@
+import asyncio
+
+from amazon_connect_mcp.cache import invalidates, ttl_cache
+
+
+def test_ttl_cache_reuses_result_per_arguments():
+    calls = []
+
+    @ttl_cache()
+    async def cache_test_describe(item_id: str, region: str | None = None) -> dict:
+        calls.append(item_id)
+        return {"Id": item_id}
+
+    async def main():
+        first = await cache_test_describe("a")
+        second = await cache_test_describe("a")
+        other = await cache_test_describe("b")
+        return first, second, other
+
+    first, second, other = asyncio.run(main())
+    assert first is second
+    assert other == {"Id": "b"}
+    assert calls == ["a", "b"]
+
+
+def test_ttl_cache_does_not_cache_errors():
+    calls = []
+
+    @ttl_cache()
+    async def cache_test_flaky() -> dict:
+        calls.append(1)
+        if len(calls) == 1:
+            raise RuntimeError("throttled")
+        return {"ok": True}
+
+    async def main():
+        try:
+            await cache_test_flaky()
+        except RuntimeError:
+            pass
+        return await cache_test_flaky()
+
+    assert asyncio.run(main()) == {"ok": True}
+    assert len(calls) == 2
+
+
+def test_invalidates_clears_named_cache_after_write():
+    calls = []
+
+    @ttl_cache()
+    async def cache_test_list() -> dict:
+        calls.append(1)
+        return {"Items": len(calls)}
+
+    @invalidates("cache_test_list")
+    async def cache_test_create() -> dict:
+        return {"created": True}
+
+    async def main():
+        before = await cache_test_list()
+        await cache_test_list()
+        await cache_test_create()
+        return before, await cache_test_list()
+
+    before, after = asyncio.run(main())
+    assert before == {"Items": 1}
+    assert after == {"Items": 2}
+
+
+def test_invalidates_keeps_cache_when_write_fails():
+    calls = []
+
+    @ttl_cache()
+    async def cache_test_list_kept() -> dict:
+        calls.append(1)
+        return {}
+
+    @invalidates("cache_test_list_kept")
+    async def cache_test_failing_create() -> dict:
+        raise RuntimeError("denied")
+
+    async def main():
+        await cache_test_list_kept()
+        try:
+            await cache_test_failing_create()
+        except RuntimeError:
+            pass
+        await cache_test_list_kept()
+
+    asyncio.run(main())
+    assert len(calls) == 1
+
+
+def test_concurrent_misses_share_one_call():
+    calls = []
+
+    @ttl_cache()
+    async def cache_test_slow(item_id: str) -> dict:
+        calls.append(item_id)
+        await asyncio.sleep(0.01)
+        return {"Id": item_id}
+
+    async def main():
+        return await asyncio.gather(*(cache_test_slow("a") for _ in range(5)))
+
+    results = asyncio.run(main())
+    assert calls == ["a"]
+    assert all(result is results[0] for result in results)
+
+
+def test_cancelled_caller_does_not_cancel_shared_call():
+    calls = []
+
+    @ttl_cache()
+    async def cache_test_shielded() -> dict:
+        calls.append(1)
+        await asyncio.sleep(0.02)
+        return {"done": True}
+
+    async def main():
+        impatient = asyncio.ensure_future(cache_test_shielded())
+        patient = asyncio.ensure_future(cache_test_shielded())
+        await asyncio.sleep(0)
+        impatient.cancel()
+        result = await patient
+        return impatient.cancelled(), result
+
+    cancelled, result = asyncio.run(main())
+    assert cancelled
+    assert result == {"done": True}
+    assert calls == [1]
@@ -0,0 +1,74 @@
+import asyncio
+import threading
+import time
+
+from amazon_connect_mcp.tools import config
+
+
+class FakeConnectClient:
+    """Creates users after a short delay, tracking how many calls overlap."""
+
+    def __init__(self, fail_usernames=()):
+        self.fail_usernames = set(fail_usernames)
+        self.lock = threading.Lock()
+        self.active = 0
+        self.max_active = 0
+
+    def create_user(self, **params):
+        with self.lock:
+            self.active += 1
+            self.max_active = max(self.max_active, self.active)
+        try:
+            # Later users finish first, so completion order differs from input order
+            time.sleep(0.05 - int(params["Username"].split("-")[1]) * 0.002)
+            if params["Username"] in self.fail_usernames:
+                raise RuntimeError(f"DuplicateResourceException: {params['Username']}")
+            return {"UserId": f"id-{params['Username']}", "UserArn": f"arn-{params['Username']}"}
+        finally:
+            with self.lock:
+                self.active -= 1
+
+
+def _users(count):
+    return [
+        {
+            "username": f"agent-{n}",
+            "routing_profile_id": "routing-profile",
+            "security_profile_ids": ["security-profile"],
+        }
+        for n in range(count)
+    ]
+
+
+def _bulk_create(monkeypatch, client, users, concurrency):
+    monkeypatch.setattr(config, "get_connect_client", lambda region: client)
+    return asyncio.run(
+        config.config_bulk_create_users("instance-1", users, concurrency=concurrency)
+    )
+
+
+def test_bulk_create_users_returns_results_in_input_order(monkeypatch):
+    users = _users(12)
+    result = _bulk_create(monkeypatch, FakeConnectClient(), users, concurrency=12)
+
+    assert [r["username"] for r in result["results"]] == [u["username"] for u in users]
+    assert [r["UserId"] for r in result["results"]] == [f"id-agent-{n}" for n in range(12)]
+    assert result["created"] == 12
+    assert result["failed"] == 0
+
+
+def test_bulk_create_users_continues_past_a_failure(monkeypatch):
+    client = FakeConnectClient(fail_usernames={"agent-3"})
+    result = _bulk_create(monkeypatch, client, _users(6), concurrency=2)
+
+    assert result["created"] == 5
+    assert result["failed"] == 1
+    assert "DuplicateResourceException" in result["results"][3]["error"]
+    assert all("UserId" in r for n, r in enumerate(result["results"]) if n != 3)
+
+
+def test_bulk_create_users_bounds_concurrent_calls(monkeypatch):
+    client = FakeConnectClient()
+    _bulk_create(monkeypatch, client, _users(15), concurrency=3)
+
+    assert client.max_active == 3
@@ -0,0 +1,48 @@
+import asyncio
+from types import SimpleNamespace
+
+from amazon_connect_mcp.tools import core
+
+
+class FakeConnectClient:
+    """Records get_current_metric_data calls and answers one result per queue."""
+
+    def __init__(self):
+        self.meta = SimpleNamespace(region_name="us-east-1")
+        self.calls = []
+
+    def get_current_metric_data(self, **params):
+        self.calls.append(params)
+        queue_ids = params["Filters"]["Queues"]
+        assert 1 <= len(queue_ids) <= 100
+        if params.get("Groupings") == ["QUEUE"]:
+            results = [{"Dimensions": {"Queue": {"Id": q}}} for q in queue_ids]
+        else:
+            results = [{"Collections": []}]
+        return {"MetricResults": results, "DataSnapshotTime": "2024-01-01T00:00:00Z"}
+
+
+def _get_current_metrics(monkeypatch, queue_ids):
+    client = FakeConnectClient()
+    monkeypatch.setattr(core, "get_connect_client", lambda region: client)
+    monkeypatch.setattr(core, "get_instance_region", lambda instance_id: "us-east-1")
+    monkeypatch.setattr(core, "get_queue_ids", lambda instance_id, region: queue_ids)
+    return client, asyncio.run(core.get_current_metrics("instance-1"))
+
+
+def test_get_current_metrics_covers_more_than_100_queues(monkeypatch):
+    queue_ids = [f"queue-{n}" for n in range(250)]
+    client, result = _get_current_metrics(monkeypatch, queue_ids)
+
+    assert sorted(len(call["Filters"]["Queues"]) for call in client.calls) == [50, 100, 100]
+    assert all(call["Groupings"] == ["QUEUE"] for call in client.calls)
+    assert all(call["Filters"]["Channels"] == ["VOICE"] for call in client.calls)
+    assert [r["Dimensions"]["Queue"]["Id"] for r in result["MetricResults"]] == queue_ids
+
+
+def test_get_current_metrics_keeps_up_to_100_queues_together(monkeypatch):
+    client, result = _get_current_metrics(monkeypatch, [f"queue-{n}" for n in range(100)])
+
+    assert len(client.calls) == 1
+    assert "Groupings" not in client.calls[0]
+    assert result["MetricResults"] == [{"Collections": []}]
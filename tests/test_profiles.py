@@ -0,0 +1,131 @@
+import asyncio
+
+import pytest
+
+from amazon_connect_mcp.tools import profiles
+
+
+class FakeProfilesClient:
+    """Answers batch_get_profile with every requested profile except "missing"."""
+
+    def __init__(self, fail_domains=()):
+        self.fail_domains = set(fail_domains)
+        self.calls = []
+
+    def batch_get_profile(self, DomainName, ProfileIds):
+        self.calls.append((DomainName, list(ProfileIds)))
+        if DomainName in self.fail_domains:
+            raise RuntimeError(f"AccessDenied: {DomainName}")
+        return {"Profiles": [{"ProfileId": p} for p in ProfileIds if p != "missing"]}
+
+
+@pytest.fixture
+def client(monkeypatch):
+    client = FakeProfilesClient()
+    monkeypatch.setattr(profiles, "get_profiles_client", lambda *args: client)
+    return client
+
+
+def test_lookups_for_the_same_profile_share_one_id(client):
+    async def main():
+        return await asyncio.gather(*(profiles._get_profile("domain", "p1") for _ in range(3)))
+
+    results = asyncio.run(main())
+    assert results == [{"ProfileId": "p1"}] * 3
+    assert client.calls == [("domain", ["p1"])]
+
+
+def test_lookups_are_split_into_batches_of_20(client):
+    profile_ids = [f"p{n}" for n in range(45)] + ["missing"]
+
+    async def main():
+        return await asyncio.gather(*(profiles._get_profile("domain", p) for p in profile_ids))
+
+    results = asyncio.run(main())
+    assert sorted(len(ids) for _, ids in client.calls) == [6, 20, 20]
+    assert results[:-1] == [{"ProfileId": p} for p in profile_ids[:-1]]
+    assert results[-1] is None
+
+
+def test_batch_error_reaches_every_waiter_of_that_batch(client):
+    client.fail_domains.add("denied")
+
+    async def main():
+        return await asyncio.gather(
+            *(profiles._get_profile("denied", p) for p in ("p1", "p1", "p2")),
+            profiles._get_profile("domain", "p3"),
+            return_exceptions=True,
+        )
+
+    *failed, ok = asyncio.run(main())
+    assert all(isinstance(r, RuntimeError) and "AccessDenied" in str(r) for r in failed)
+    assert ok == {"ProfileId": "p3"}
+
+
+def test_malformed_response_fails_only_its_batch(monkeypatch):
+    class MalformedClient(FakeProfilesClient):
+        def batch_get_profile(self, DomainName, ProfileIds):
+            if DomainName == "broken":
+                return {"Profiles": [{"Id": p} for p in ProfileIds]}
+            return super().batch_get_profile(DomainName, ProfileIds)
+
+    monkeypatch.setattr(profiles, "get_profiles_client", lambda *args: MalformedClient())
+
+    async def main():
+        return await asyncio.gather(
+            profiles._get_profile("broken", "p1"),
+            profiles._get_profile("domain", "p2"),
+            return_exceptions=True,
+        )
+
+    broken, ok = asyncio.run(main())
+    assert isinstance(broken, KeyError)
+    assert ok == {"ProfileId": "p2"}
+
+
+def _cancel_flush_test(client, yields_before_cancel):
+    async def main():
+        lookup = asyncio.ensure_future(profiles._get_profile("domain", "p1"))
+        for _ in range(yields_before_cancel):
+            await asyncio.sleep(0)
+        (flush,) = profiles._flush_tasks
+        flush.cancel()
+        with pytest.raises(asyncio.CancelledError):
+            await lookup
+        # The next lookup starts a fresh flush instead of waiting on the cancelled one
+        return await asyncio.wait_for(profiles._get_profile("domain", "p2"), timeout=5)
+
+    assert asyncio.run(main()) == {"ProfileId": "p2"}
+    assert not profiles._flush_tasks
+
+
+def test_flush_cancelled_before_it_starts_cancels_its_waiters(client):
+    _cancel_flush_test(client, yields_before_cancel=1)
+
+
+def test_flush_cancelled_mid_call_cancels_its_waiters(client):
+    _cancel_flush_test(client, yields_before_cancel=2)
+
+
+def test_get_profile_does_not_cache_a_miss(monkeypatch):
+    created = set()
+
+    class EventuallyConsistentClient(FakeProfilesClient):
+        def batch_get_profile(self, DomainName, ProfileIds):
+            self.calls.append((DomainName, list(ProfileIds)))
+            return {"Profiles": [{"ProfileId": p} for p in ProfileIds if p in created]}
+
+    client = EventuallyConsistentClient()
+    monkeypatch.setattr(profiles, "get_profiles_client", lambda *args: client)
+
+    async def main():
+        miss = await profiles.profiles_get_profile("cache-domain", "new")
+        created.add("new")
+        found = await profiles.profiles_get_profile("cache-domain", "new")
+        again = await profiles.profiles_get_profile("cache-domain", "new")
+        return miss, found, again
+
+    miss, found, again = asyncio.run(main())
+    assert miss == {"error": "Profile not found", "ProfileId": "new"}
+    assert found == again == {"ProfileId": "new"}
+    assert len(client.calls) == 2
@@ -0,0 +1,25 @@
+import pytest
+
+from amazon_connect_mcp.tools.visualizer_server import _accepts_gzip
+
+
+@pytest.mark.parametrize(
+    ("accept_encoding", "expected"),
+    [
+        ("gzip, deflate, br", True),
+        ("GZIP", True),
+        ("br;q=1.0, gzip;q=0.8", True),
+        ("x-gzip", True),
+        ("*", True),
+        ("gzip;q=0", False),
+        ("gzip; q=0.000, *", False),
+        ("*;q=0", False),
+        ("identity", False),
+        ("deflate, br", False),
+        ("", False),
+        ("gzip;q=bogus", False),
+        ("notgzip", False),
+    ],
+)
+def test_accepts_gzip(accept_encoding, expected):
+    assert _accepts_gzip(accept_encoding) is expected